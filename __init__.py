@@ -56,6 +56,10 @@ if "bpy" in locals():
         importlib.reload(perfmon)
     if "c3d_parse_dictionary" in locals():
         importlib.reload(c3d_parse_dictionary)
+    if "c3d_metadata_cache" in locals():
+        importlib.reload(c3d_metadata_cache)
+    if "c3d_pipeline" in locals():
+        importlib.reload(c3d_pipeline)
     if "c3d_importer" in locals():
         importlib.reload(c3d_importer)
 
@@ -167,6 +171,43 @@ class ImportC3D(bpy.types.Operator, ImportHelper):
         soft_min=0., soft_max=100.0,
     )
 
+    keyframe_tolerance: FloatProperty(
+        name="Keyframe Reduction", default=0.0,
+        description="Remove keyframes that can be linearly interpolated from the remaining keyframes within " +
+                    "the specified distance (in scene units). Reduced keyframes use linear interpolation, " +
+                    "overriding the interpolation setting. If the value is equal to 0, all samples are keyframed",
+        min=0., max=1000.0,
+        soft_min=0., soft_max=0.1,
+        precision=4,
+    )
+
+    # -----
+    # Frame range settings
+    # -----
+    frame_start: IntProperty(
+        name="Start Frame",
+        description="Index of the first frame to import, counted from the first frame recorded in the file. " +
+                    "Keyframes retain their timing relative to the start of the recording",
+        default=0,
+        min=0,
+    )
+
+    frame_end: IntProperty(
+        name="End Frame",
+        description="Index of the last frame to import (inclusive), counted from the first frame recorded in the " +
+                    "file. If negative, frames are imported until the end of the recording",
+        default=-1,
+        min=-1,
+    )
+
+    frame_step: IntProperty(
+        name="Frame Step",
+        description="Import every n:th frame in the range, frames in between are skipped without being read",
+        default=1,
+        min=1,
+        soft_max=100,
+    )
+
     # -----
     # Armature settings
     # -----
@@ -199,6 +240,13 @@ class ImportC3D(bpy.types.Operator, ImportHelper):
         default=False,
     )
 
+    use_metadata_cache: BoolProperty(
+        name="Cache Metadata",
+        description="Store metadata interpreted from imported files in a cache on disk, re-importing a file " +
+                    "that has not changed since it was cached will use the cached metadata",
+        default=True,
+    )
+
     # -----
     # Debug settings.
     # -----
@@ -224,19 +272,9 @@ class ImportC3D(bpy.types.Operator, ImportHelper):
         import os
 
         if self.files:
-            failed = []
-            for file in self.files:
-                path = os.path.join(self.directory, file.name)
-                try:
-                    msg = c3d_importer.load(self, context, filepath=path, **keywords)
-                    if msg != {'FINISHED'}:
-                        failed.append(path)
-                except Exception as e:
-                    import traceback
-                    print('')
-                    traceback.print_exc()
-                    print('')
-                    failed.append(path)
+            # Decode files in parallel, Blender data is created on the main thread.
+            paths = [os.path.join(self.directory, file.name) for file in self.files]
+            failed = c3d_importer.load_files(self, context, paths, **keywords)
 
             # Report any file issue(s)
             if failed:
@@ -290,6 +328,35 @@ class C3D_PT_action(bpy.types.Panel):
         layout.prop(operator, "include_empty_labels")
         layout.prop(operator, "interpolation")
         layout.prop(operator, "max_residual")
+        layout.prop(operator, "keyframe_tolerance")
+        layout.prop(operator, "use_metadata_cache")
+
+
+class C3D_PT_import_frame_range(bpy.types.Panel):
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = "Frame Range"
+    bl_parent_id = "FILE_PT_operator"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+
+        return operator.bl_idname == "IMPORT_ANIM_OT_c3d"
+
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False  # No animation.
+
+        sfile = context.space_data
+        operator = sfile.active_operator
+
+        layout.prop(operator, "frame_start")
+        layout.prop(operator, "frame_end")
+        layout.prop(operator, "frame_step")
 
 
 class C3D_PT_marker_armature(bpy.types.Panel):
@@ -426,6 +493,7 @@ def menu_func_import(self, context):
 classes = (
     ImportC3D,
     C3D_PT_action,
+    C3D_PT_import_frame_range,
     C3D_PT_marker_armature,
     C3D_PT_import_transform,
     C3D_PT_import_transform_manual_orientation,
@@ -22,8 +22,11 @@ See the [main page] or [github page].
 from . import dtypes
 from . import group
 from . import header
+from . import layout
 from . import manager
 from . import parameter
+from . import probing
 from . import utils
+from .probing import probe
 from .reader import Reader
 from .writer import Writer
@@ -3,7 +3,6 @@ State object defining the data types associated with a given .c3d processor form
 '''
 
 import sys
-import codecs
 import numpy as np
 
 PROCESSOR_INTEL = 84
@@ -14,7 +13,15 @@ PROCESSOR_MIPS = 86
 class DataTypes(object):
     ''' Container defining the data types used when parsing byte data.
         Data types depend on the processor format the file is stored in.
+
+        Instances are not modified after construction, see `c3d.dtypes.DataTypes.shared`.
     '''
+    __slots__ = ('_proc_type', '_little_endian_sys', '_native',
+                 'float32', 'float64', 'uint8', 'uint16', 'uint32', 'uint64', 'int8', 'int16', 'int32', 'int64')
+
+    # Instances shared between files, see `c3d.dtypes.DataTypes.shared`
+    _shared = {}
+
     def __init__(self, proc_type=PROCESSOR_INTEL):
         self._proc_type = proc_type
         self._little_endian_sys = sys.byteorder == 'little'
@@ -48,6 +55,15 @@ class DataTypes(object):
             self.int32 = np.int32
             self.int64 = np.int64
 
+    @classmethod
+    def shared(cls, proc_type=PROCESSOR_INTEL):
+        ''' Get a `c3d.dtypes.DataTypes` instance for the processor type shared with other files of the same type.
+        '''
+        dtypes = cls._shared.get(proc_type)
+        if dtypes is None:
+            dtypes = cls._shared[proc_type] = cls(proc_type)
+        return dtypes
+
     @property
     def is_ieee(self) -> bool:
         ''' True if the associated file is in the Intel format.
@@ -98,14 +114,14 @@ class DataTypes(object):
         return not self._little_endian_sys
 
     def decode_string(self, bytes) -> str:
-        ''' Decode a byte array to a string.
+        ''' Decode a byte array (or other bytes-like object) to a string.
         '''
         # Attempt to decode using different decoders
         decoders = ['utf-8', 'latin-1']
         for dec in decoders:
             try:
-                return codecs.decode(bytes, dec)
+                return str(bytes, dec)
             except UnicodeDecodeError:
                 continue
         # Revert to using default decoder but replace characters
-        return codecs.decode(bytes, decoders[0], 'replace')
+        return str(bytes, decoders[0], 'replace')
@@ -1,6 +1,8 @@
 ''' Classes used to represent the concept of parameter groups in a .c3d file.
 '''
+import copy
 import struct
+import weakref
 import numpy as np
 from .parameter import ParamData, Param
 from .utils import Decorator
@@ -22,17 +24,36 @@ class GroupData(object):
     desc : str
         Description for this parameter group.
     '''
+    __slots__ = ('_params', '_dtypes', '_owner', 'name', 'desc')
 
-    def __init__(self, dtypes, name=None, desc=None):
+    def __init__(self, dtypes, name=None, desc=None, owner=None):
         self._params = {}
         self._dtypes = dtypes
+        self._owner = None
+        self.name = None
         # Assign through property setters
         self.set_name(name)
         self.set_desc(desc)
+        self._set_owner(owner)
 
     def __repr__(self):
         return '<Group: {}>'.format(self.desc)
 
+    def __getstate__(self):
+        # The owner is not copied, managers take ownership when restored (see `c3d.manager.Manager.__setstate__`)
+        return {name: getattr(self, name) for name in self.__slots__ if name != '_owner'}
+
+    def __setstate__(self, state):
+        self._owner = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __deepcopy__(self, memo):
+        data = GroupData.__new__(GroupData)
+        memo[id(self)] = data
+        data.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return data
+
     def __contains__(self, key):
         return key in self._params
 
@@ -49,10 +70,25 @@ class GroupData(object):
             1 + len(self.desc.encode('utf-8')) +  # size of desc and desc bytes
             sum(p.binary_size for p in self._params.values()))
 
+    def _set_owner(self, manager):
+        ''' Set the `c3d.manager.Manager` indexing the parameters in this group (or None).
+        '''
+        self._owner = None if manager is None else weakref.ref(manager)
+
+    def _manager(self):
+        ''' Get the `c3d.manager.Manager` indexing the parameters in this group, or None.
+        '''
+        return None if self._owner is None else self._owner()
+
     def set_name(self, name):
         ''' Set the group name string. '''
         if name is None or isinstance(name, str):
+            manager = self._manager()
+            if manager is not None:
+                manager._unindex_params(self)
             self.name = name
+            if manager is not None:
+                manager._index_params(self)
         else:
             raise TypeError('Expected group name to be string, was %s.' % type(name))
 
@@ -90,6 +126,9 @@ class GroupData(object):
         if name in self._params:
             raise KeyError('Parameter already exists with key {}'.format(name))
         self._params[name] = Param(ParamData(name, self._dtypes, **kwargs))
+        manager = self._manager()
+        if manager is not None:
+            manager._index_params(self, [name])
 
     def remove_param(self, name):
         '''Remove the specified parameter.
@@ -100,6 +139,9 @@ class GroupData(object):
             Name for the parameter to remove.
         '''
         del self._params[name]
+        manager = self._manager()
+        if manager is not None:
+            manager._unindex_params(self, [name])
 
     def rename_param(self, name, new_name):
         ''' Rename a specified parameter group.
@@ -127,6 +169,10 @@ class GroupData(object):
             param = self._params[name]
         del self._params[name]
         self._params[new_name] = param
+        manager = self._manager()
+        if manager is not None:
+            manager._unindex_params(self, [name])
+            manager._index_params(self, [new_name])
 
     def write(self, group_id, handle):
         '''Write this parameter group, with parameters, to a file handle.
@@ -152,6 +198,8 @@ class GroupData(object):
 class GroupReadonly(object):
     ''' Wrapper exposing readonly attributes of a `c3d.group.GroupData` entry.
     '''
+    __slots__ = ('_data',)
+
     def __init__(self, data):
         self._data = data
 
@@ -243,12 +291,17 @@ class GroupReadonly(object):
 class Group(GroupReadonly):
     ''' Wrapper exposing readable and writeable attributes of a `c3d.group.GroupData` entry.
     '''
+    __slots__ = ('_readonly',)
+
     def __init__(self, data):
         super(Group, self).__init__(data)
+        self._readonly = None
 
     def readonly(self):
         ''' Returns a `c3d.group.GroupReadonly` instance with readonly access. '''
-        return GroupReadonly(self._data)
+        if self._readonly is None:
+            self._readonly = GroupReadonly(self._data)
+        return self._readonly
 
     @property
     def name(self) -> str:
@@ -48,6 +48,10 @@ class Header(object):
         POINTS:ACTUAL_END_FIELD parameters.
     '''
 
+    __slots__ = ('parameter_block', 'data_block', 'point_count', 'analog_count', 'first_frame', 'last_frame',
+                 'analog_per_frame', 'frame_rate', 'max_gap', 'scale_factor', 'long_event_labels', 'event_count',
+                 'event_block', 'event_timings', 'event_disp_flags', 'event_labels')
+
     # Read/Write header formats, read values as unsigned ints rather then floats.
     BINARY_FORMAT_WRITE = '<BBHHHHHfHHf274sHHH164s44s'
     BINARY_FORMAT_READ = '<BBHHHHHIHHI274sHHH164s44s'
@@ -0,0 +1,188 @@
+''' Immutable snapshot of the data section layout, derived from the metadata of a .c3d file.
+'''
+from collections import namedtuple
+import numpy as np
+
+DataLayout = namedtuple('DataLayout', [
+    'first_frame',
+    'frame_count',
+    'point_used',
+    'analog_used',
+    'analog_per_frame',
+    'point_scale',
+    'is_float',
+    'is_dec',
+    'point_dtype',
+    'analog_dtype',
+    'block_dtype',
+    'point_bytes',
+    'analog_bytes',
+    'frame_bytes',
+    'data_offset',
+    'analog_scales',
+    'analog_offsets',
+])
+DataLayout.__doc__ = '''Byte layout and decode parameters of the data section, see `c3d.layout.data_layout`.'''
+
+
+def data_layout(manager, dtypes):
+    '''Evaluate the layout of the data section from the header and parameters of a file.
+
+    Derived metadata (such as `c3d.manager.Manager.frame_count`) is evaluated through a number of
+    parameter lookups, the layout is intended to be computed once and reused when reading data.
+
+    Parameters
+    ----------
+    manager : `c3d.manager.Manager`
+        Manager containing the header and parameters of the file.
+    dtypes : `c3d.dtypes.DataTypes`
+        Data types for the processor format of the file.
+
+    Returns
+    -------
+    layout : `c3d.layout.DataLayout`
+        Named tuple where:
+        - `point_dtype` and `analog_dtype` are the types of words in the POINT and ANALOG blocks, in the
+          byte order of the file (DEC floats are typed as raw 32-bit words).
+        - `block_dtype` is a structured type of a single frame, with fields 'point' of shape
+          (point_used, 4) and 'analog' of shape (analog_per_frame, analog_used).
+        - `point_bytes`, `analog_bytes` and `frame_bytes` are the sizes of the blocks in each frame.
+        - `data_offset` is the byte offset to the first frame in the file.
+        - `analog_scales` and `analog_offsets` are read-only arrays of shape (analog_used, analog_per_frame),
+          see `c3d.manager.Manager.get_analog_transform`.
+
+    Raises
+    ------
+    NotImplementedError
+        If the ANALOG:BITS parameter is not supported.
+    '''
+    point_scale = float(manager.point_scale)
+    point_dtype, analog_dtype = _data_dtypes(manager, dtypes, point_scale)
+    analog_scales, analog_offsets = manager.get_analog_transform()
+    first_frame = int(manager.first_frame)
+    return _make_layout(
+        first_frame=first_frame,
+        frame_count=int(manager.last_frame) - first_frame + 1,
+        point_used=int(manager.point_used),
+        analog_used=int(manager.analog_used),
+        analog_per_frame=int(manager.analog_per_frame),
+        point_scale=point_scale,
+        is_dec=point_scale < 0 and dtypes.is_dec,
+        point_dtype=point_dtype,
+        analog_dtype=analog_dtype,
+        data_offset=(manager.header.data_block - 1) * 512,
+        analog_scales=analog_scales,
+        analog_offsets=analog_offsets,
+    )
+
+
+def layout_to_dict(layout):
+    '''Convert a layout to a dictionary of JSON serializable values, see `c3d.layout.layout_from_dict`.
+
+    Parameters
+    ----------
+    layout : `c3d.layout.DataLayout`
+        Layout to convert.
+
+    Returns
+    -------
+    values : dict
+        Values required to restore the layout, data types are stored as type strings (such as '<f4').
+    '''
+    return {
+        'first_frame': layout.first_frame,
+        'frame_count': layout.frame_count,
+        'point_used': layout.point_used,
+        'analog_used': layout.analog_used,
+        'analog_per_frame': layout.analog_per_frame,
+        'point_scale': layout.point_scale,
+        'is_dec': layout.is_dec,
+        'point_dtype': layout.point_dtype.str,
+        'analog_dtype': layout.analog_dtype.str,
+        'data_offset': layout.data_offset,
+        'analog_scales': np.asarray(layout.analog_scales).tolist(),
+        'analog_offsets': np.asarray(layout.analog_offsets).tolist(),
+    }
+
+
+def layout_from_dict(values):
+    '''Restore a layout from a dictionary created by `c3d.layout.layout_to_dict`.
+
+    Parameters
+    ----------
+    values : dict
+        Values describing the layout.
+
+    Returns
+    -------
+    layout : `c3d.layout.DataLayout`
+        Layout equal to the layout the values were created from.
+    '''
+    shape = (values['analog_used'], values['analog_per_frame'])
+    return _make_layout(
+        first_frame=int(values['first_frame']),
+        frame_count=int(values['frame_count']),
+        point_used=int(values['point_used']),
+        analog_used=int(values['analog_used']),
+        analog_per_frame=int(values['analog_per_frame']),
+        point_scale=float(values['point_scale']),
+        is_dec=bool(values['is_dec']),
+        point_dtype=np.dtype(values['point_dtype']),
+        analog_dtype=np.dtype(values['analog_dtype']),
+        data_offset=int(values['data_offset']),
+        analog_scales=np.array(values['analog_scales'], float).reshape(shape),
+        analog_offsets=np.array(values['analog_offsets'], int).reshape(shape),
+    )
+
+
+def _make_layout(first_frame, frame_count, point_used, analog_used, analog_per_frame, point_scale, is_dec,
+                 point_dtype, analog_dtype, data_offset, analog_scales, analog_offsets):
+    '''Create a layout, evaluating the block type and sizes from the remaining values.
+    '''
+    block_dtype = np.dtype([('point', point_dtype, (point_used, 4)),
+                            ('analog', analog_dtype, (analog_per_frame, analog_used))])
+    point_bytes = block_dtype.fields['point'][0].itemsize
+    for array in (analog_scales, analog_offsets):
+        if array.flags.writeable:
+            array.setflags(write=False)
+    return DataLayout(
+        first_frame=first_frame,
+        frame_count=frame_count,
+        point_used=point_used,
+        analog_used=analog_used,
+        analog_per_frame=analog_per_frame,
+        point_scale=point_scale,
+        is_float=point_scale < 0,
+        is_dec=is_dec,
+        point_dtype=point_dtype,
+        analog_dtype=analog_dtype,
+        block_dtype=block_dtype,
+        point_bytes=point_bytes,
+        analog_bytes=block_dtype.itemsize - point_bytes,
+        frame_bytes=block_dtype.itemsize,
+        data_offset=data_offset,
+        analog_scales=analog_scales,
+        analog_offsets=analog_offsets,
+    )
+
+
+def _data_dtypes(manager, dtypes, point_scale):
+    '''Determine the data types used to store words in the POINT and ANALOG data blocks.
+    '''
+    if point_scale < 0:
+        # Note*: Floating point is 'always' defined for both analog and point data, according to the standard.
+        if dtypes.is_dec:
+            # DEC floats are read as raw 32-bit words and converted to IEEE when decoded.
+            return np.dtype(dtypes.uint32), np.dtype(dtypes.uint32)
+        return np.dtype(dtypes.float32), np.dtype(dtypes.float32)
+
+    # TODO: handle ANALOG:BITS parameter here!
+    p = manager.get('ANALOG:FORMAT')
+    analog_unsigned = p and p.string_value.strip().upper() == 'UNSIGNED'
+    if analog_unsigned:
+        # Verify BITS parameter for analog
+        p = manager.get('ANALOG:BITS')
+        if p and p._as_any_uint / 8 != 2:
+            raise NotImplementedError('Analog data using {} bits is not supported.'.format(p._as_any_uint))
+        return np.dtype(dtypes.int16), np.dtype(dtypes.uint16)
+    return np.dtype(dtypes.int16), np.dtype(dtypes.int16)
@@ -1,5 +1,6 @@
 ''' Manager base class defining common attributes for both Reader and Writer instances.
 '''
+import copy
 import numpy as np
 import warnings
 from .header import Header
@@ -24,6 +25,24 @@ class Manager(object):
         '''Set up a new Manager with a Header.'''
         self._header = header or Header()
         self._groups = {}
+        # Flat table of the parameters in all named groups, keyed by 'GROUP:PARAM' (see `Manager.get`)
+        self._params = {}
+
+    def __getstate__(self):
+        # Groups are restored without an owner and the parameter table is rebuilt, see `Manager.__setstate__`
+        state = self.__dict__.copy()
+        del state['_params']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._set_groups(self._groups)
+
+    def __deepcopy__(self, memo):
+        manager = self.__class__.__new__(self.__class__)
+        memo[id(self)] = manager
+        manager.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return manager
 
     def __contains__(self, key):
         return key in self._groups
@@ -154,7 +173,7 @@ class Manager(object):
             raise KeyError('Group with numerical key {} already exists'.format(group_id))
         if name in self._groups:
             raise KeyError('No group matched name key {}'.format(name))
-        group = self._groups[name] = self._groups[group_id] = Group(GroupData(self._dtypes, name, desc))
+        group = self._groups[name] = self._groups[group_id] = Group(GroupData(self._dtypes, name, desc, owner=self))
         return group
 
     def _remove_group(self, group_id):
@@ -171,6 +190,8 @@ class Manager(object):
         gkeys = [k for (k, v) in self._groups.items() if v == grp]
         for k in gkeys:
             del self._groups[k]
+        self._unindex_params(grp._data)
+        grp._data._set_owner(None)
 
     def _rename_group(self, group_id, new_group_id):
         ''' Rename a specified parameter group.
@@ -188,7 +209,8 @@ class Manager(object):
             If a group with a duplicate ID or name already exists.
         '''
         if isinstance(group_id, GroupReadonly):
-            grp = group_id._data
+            # Managed entries are writable wrappers
+            grp = group_id if isinstance(group_id, Group) else Group(group_id._data)
         else:
             # Aquire instance using id
             grp = self._groups.get(group_id, None)
@@ -203,6 +225,7 @@ class Manager(object):
         if isinstance(new_group_id, (str, bytes)):
             if grp.name in self._groups:
                 del self._groups[grp.name]
+            # Parameter keys are updated by the group
             grp.name = new_group_id
         elif is_integer(new_group_id):
             new_group_id = int(new_group_id)  # Ensure python int
@@ -212,6 +235,45 @@ class Manager(object):
         # Update
         self._groups[new_group_id] = grp
 
+    def _set_groups(self, groups):
+        '''Replace the parameter groups, taking ownership of the group entries.
+
+        Parameters
+        ----------
+        groups : dict
+            Dictionary of `c3d.group.Group` entries keyed by both name and numerical ID.
+        '''
+        self._groups = groups
+        self._params = {}
+        for data in set(grp._data for grp in groups.values()):
+            data._set_owner(self)
+            self._index_params(data)
+
+    def _index_params(self, data, names=None):
+        '''Insert parameters of a group in the flat 'GROUP:PARAM' lookup table.
+
+        Parameters
+        ----------
+        data : `c3d.group.GroupData`
+            Group containing the parameters, parameters in groups without a name are not indexed.
+        names : iterable of str, optional
+            Keys of the parameters to insert, defaults to all parameters in the group.
+        '''
+        if data.name is None:
+            return
+        for name in (data._params if names is None else names):
+            self._params['{}:{}'.format(data.name, name)] = data._params[name]
+
+    def _unindex_params(self, data, names=None):
+        '''Remove parameters of a group from the flat 'GROUP:PARAM' lookup table.
+
+        See `c3d.manager.Manager._index_params` for arguments.
+        '''
+        if data.name is None:
+            return
+        for name in (data._params if names is None else names):
+            self._params.pop('{}:{}'.format(data.name, name), None)
+
     def get(self, group, default=None):
         '''Get a group or parameter.
 
@@ -237,6 +299,12 @@ class Manager(object):
             if group is None:
                 return default
             return group
+        # Keys on canonical form ('GROUP:PARAM' or 'GROUP') are found with a single lookup
+        value = self._params.get(group)
+        if value is None:
+            value = self._groups.get(group)
+        if value is not None:
+            return value
         group = group.upper()
         param = None
         if '.' in group:
@@ -337,7 +405,7 @@ class Manager(object):
         param = self.get('TRIAL:ACTUAL_START_FIELD')
         if param is not None:
             # ACTUAL_START_FIELD is encoded in two 16 byte words...
-            return param.uint32_value
+            return _field_value(param)
         return self.header.first_frame
 
     @property
@@ -352,9 +420,7 @@ class Manager(object):
         param = self.get('TRIAL:ACTUAL_END_FIELD')
         if param is not None:
             # Encoded as 2 16 bit words (rather then 1 32 bit word)
-            # words = param.uint16_array
-            # end_frame[1] = words[0] + words[1] * 65536
-            end_frame = param.uint32_value
+            end_frame = _field_value(param)
             if hlf <= end_frame:
                 return end_frame
         param = self.get('POINT:LONG_FRAMES')
@@ -462,3 +528,14 @@ class Manager(object):
         analog_scales = np.broadcast_to(analog_scales[:, np.newaxis], (self.analog_used, self.analog_per_frame))
         analog_offsets = np.broadcast_to(analog_offsets[:, np.newaxis], (self.analog_used, self.analog_per_frame))
         return analog_scales, analog_offsets
+
+
+def _field_value(param):
+    '''Decode a TRIAL:ACTUAL_*_FIELD parameter, a 32 bit frame number stored as two 16 bit words (low word first).
+
+    The words are in the byte order of the processor, equivalent to a single 32 bit word for little endian formats.
+    '''
+    if param.bytes_per_element == 2 and param.num_elements >= 2:
+        words = param.uint16_array
+        return int(words[0]) + int(words[1]) * 65536
+    return param.uint32_value
@@ -2,7 +2,47 @@
 '''
 import struct
 import numpy as np
-from .utils import DEC_to_IEEE, DEC_to_IEEE_BYTES
+from .utils import DEC_to_IEEE, DEC_to_IEEE_ARRAY
+
+
+def parameter_records(section, dtypes):
+    '''Iterate over the group and parameter records in the parameter section.
+
+    Parameters
+    ----------
+    section : memoryview
+        Buffer containing the parameter section, including the 4 byte section header.
+    dtypes : `c3d.dtypes.DataTypes`
+        Data types for the processor format of the file.
+
+    Returns
+    -------
+    records : iterable of (int, str, int, int)
+        Tuples of (group id, name, start, end) for each record in the section, where the
+        [start, end) byte range of `section` is the record content following the offset to the
+        next record. Group ids are negative for group records and positive for parameter records.
+    '''
+    offset_fmt = ['<h', '>h'][dtypes.is_mips]
+    offset = 4
+    end = len(section)
+    while offset < end:
+        chars_in_name, group_id = struct.unpack_from('bb', section, offset)
+        if group_id == 0 or chars_in_name == 0:
+            # we've reached the end of the parameter section.
+            break
+        offset += 2
+        name = dtypes.decode_string(section[offset:offset + abs(chars_in_name)]).upper()
+        offset += abs(chars_in_name)
+
+        offset_to_next, = struct.unpack_from(offset_fmt, section, offset)
+        start = offset + 2
+        if offset_to_next == 0:
+            # Last parameter, as number of bytes are unknown,
+            # use the remaining bytes in the parameter section.
+            offset = end
+        else:
+            offset += offset_to_next
+        yield group_id, name, start, min(offset, end)
 
 
 class ParamData(object):
@@ -19,7 +59,7 @@ class ParamData(object):
     bytes_per_element : int, optional
         For array data, this describes the size of each element of data. For
         string data (including arrays of strings), this should be -1.
-    dimensions : list of int
+    dimensions : sequence of int
         For array data, this describes the dimensions of the array, stored in
         column-major (Fortran) order. For arrays of strings, the dimensions here will be
         the number of columns (length of each string) followed by the number of
@@ -27,6 +67,8 @@ class ParamData(object):
     bytes : str
         Raw data for this parameter.
     '''
+    # Buffer is listed last, attributes are read (and the buffer released) before it when copied.
+    __slots__ = ('name', 'dtypes', 'desc', 'bytes_per_element', 'dimensions', 'bytes', '_buffer')
 
     def __init__(self,
                  name,
@@ -35,16 +77,45 @@ class ParamData(object):
                  bytes_per_element=1,
                  dimensions=None,
                  bytes=b'',
-                 handle=None):
-        '''Set up a new parameter, only the name is required.'''
+                 handle=None,
+                 buffer=None,
+                 lazy=False):
+        '''Set up a new parameter, only the name is required.
+
+        If `handle` or `buffer` is given, the parameter is read from the file handle or buffer,
+        see `c3d.parameter.ParamData.read` and `c3d.parameter.ParamData.read_buffer`. If `lazy`
+        is True, reading the `buffer` is deferred until an attribute other than the name is accessed.
+        '''
         self.name = name
         self.dtypes = dtype
+        self._buffer = None
+        if buffer is not None and lazy:
+            # Remaining attributes are assigned when the buffer is read, see __getattr__
+            self._buffer = buffer
+            return
         self.desc = desc
         self.bytes_per_element = bytes_per_element
         self.dimensions = dimensions or []
         self.bytes = bytes
         if handle:
             self.read(handle)
+        elif buffer is not None:
+            self.read_buffer(buffer)
+
+    def __getattr__(self, name):
+        '''Read the parameter buffer on first access of an attribute that is not yet assigned.'''
+        # Only called for unassigned slots, the buffer slot is unassigned for instances created by copy/pickle
+        buffer = None if name == '_buffer' or name.startswith('__') else self._buffer
+        if buffer is None:
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+        self._buffer = None
+        self.read_buffer(buffer)
+        return getattr(self, name)
+
+    @property
+    def is_loaded(self) -> bool:
+        '''True if the parameter data has been read, False if reading is deferred.'''
+        return self._buffer is None
 
     def __repr__(self):
         return '<Param: {}>'.format(self.desc)
@@ -115,6 +186,36 @@ class ParamData(object):
         desc_size, = struct.unpack('B', handle.read(1))
         self.desc = desc_size and self.dtypes.decode_string(handle.read(desc_size)) or ''
 
+    def read_buffer(self, buffer, offset=0):
+        '''Read binary data for this parameter from a buffer.
+
+        Parameters
+        ----------
+        buffer : bytes-like
+            Buffer containing the parameter, such as a `memoryview` of the parameter section.
+        offset : int, default=0
+            Byte offset in the buffer to the start of the parameter data (the byte following the offset
+            to the next parameter).
+
+        Returns
+        -------
+        offset : int
+            Byte offset in the buffer following the parameter.
+        '''
+        self.bytes_per_element, dims = struct.unpack_from('bB', buffer, offset)
+        offset += 2
+        self.dimensions = struct.unpack_from('%dB' % dims, buffer, offset)
+        offset += dims
+        total_bytes = abs(self.bytes_per_element)
+        for d in self.dimensions:
+            total_bytes *= d
+        self.bytes = bytes(buffer[offset:offset + total_bytes])
+        offset += total_bytes
+        desc_size, = struct.unpack_from('B', buffer, offset)
+        offset += 1
+        self.desc = desc_size and self.dtypes.decode_string(buffer[offset:offset + desc_size]) or ''
+        return offset + desc_size
+
     def _as(self, dtype):
         '''Unpack the raw bytes of this param using the given struct format.'''
         return np.frombuffer(self.bytes, count=1, dtype=dtype)[0]
@@ -134,6 +235,7 @@ class ParamData(object):
 class ParamReadonly(object):
     ''' Wrapper exposing readonly attributes of a `c3d.parameter.ParamData` entry.
     '''
+    __slots__ = ('_data',)
 
     def __init__(self, data):
         self._data = data
@@ -305,7 +407,7 @@ class ParamReadonly(object):
             # _as_array but for DEC
             if not self.dimensions:
                 return [self.float_value]
-            return DEC_to_IEEE_BYTES(self._data.bytes).reshape(self.dimensions[::-1])  # Reverse fortran format
+            return DEC_to_IEEE_ARRAY(self._data._as_array(np.uint32, copy=False))
         else:  # is_ieee or is_mips
             return self._data._as_array(self.dtypes.float32)
 
@@ -364,7 +466,11 @@ class ParamReadonly(object):
 
     @property
     def bytes_array(self):
-        '''Get the parameter data as an array of raw byte strings.'''
+        '''Get the parameter data as an array of fixed-width byte strings.
+
+        For multi-dimensional parameters the first dimension is the length of each string, and the
+        array is a readonly view of the parameter bytes with the shape of the remaining dimensions.
+        '''
         # Decode different dimensions
         if len(self.dimensions) == 0:
             return np.array([])
@@ -374,18 +480,18 @@ class ParamReadonly(object):
             # Convert Fortran shape (data in memory is identical, shape is transposed)
             word_len = self.dimensions[0]
             dims = self.dimensions[1:][::-1]  # Identical to: [:0:-1]
-            byte_steps = np.cumprod(self.dimensions[:-1])[::-1]
-            # Generate mult-dimensional array and parse byte words
-            byte_arr = np.empty(dims, dtype=object)
-            for i in np.ndindex(*dims):
-                # Calculate byte offset as sum of each array index times the byte step of each dimension.
-                off = np.sum(np.multiply(i, byte_steps))
-                byte_arr[i] = self._data.bytes[off:off+word_len]
-            return byte_arr
+            count = int(np.prod(dims))
+            if word_len == 0:
+                return np.zeros(dims, dtype='S1')
+            data = self._data.bytes
+            if len(data) < word_len * count:
+                # Pad truncated parameter data
+                data = data.ljust(word_len * count)
+            return np.frombuffer(data, dtype='S%i' % word_len, count=count).reshape(dims)
 
     @property
     def string_array(self):
-        '''Get the parameter data as a python array of unicode strings.'''
+        '''Get the parameter data as an array of unicode strings.'''
         # Decode different dimensions
         if len(self.dimensions) == 0:
             return np.array([])
@@ -394,10 +500,12 @@ class ParamReadonly(object):
         else:
             # Parse byte sequences
             byte_arr = self.bytes_array
-            # Decode sequences
-            for i in np.ndindex(byte_arr.shape):
-                byte_arr[i] = self.dtypes.decode_string(byte_arr[i])
-            return byte_arr
+            try:
+                return np.char.decode(byte_arr, 'utf-8')
+            except UnicodeDecodeError:
+                # Decode each sequence, falling back to alternative decoders
+                strings = [self.dtypes.decode_string(b) for b in byte_arr.ravel()]
+                return np.array(strings, dtype=str).reshape(byte_arr.shape)
 
     @property
     def any_value(self):
@@ -468,12 +576,17 @@ class ParamReadonly(object):
 class Param(ParamReadonly):
     ''' Wrapper exposing both readable and writable attributes of a `c3d.parameter.ParamData` entry.
     '''
+    __slots__ = ('_readonly',)
+
     def __init__(self, data):
         super(Param, self).__init__(data)
+        self._readonly = None
 
     def readonly(self):
         ''' Returns a readonly `c3d.parameter.ParamReadonly` instance. '''
-        return ParamReadonly(self._data)
+        if self._readonly is None:
+            self._readonly = ParamReadonly(self._data)
+        return self._readonly
 
     @property
     def bytes(self) -> bytes:
@@ -0,0 +1,117 @@
+''' Functions for probing metadata from a .c3d file without reading the complete file.
+'''
+import struct
+from collections import namedtuple
+from .dtypes import DataTypes
+from .header import Header
+from .manager import Manager
+from .parameter import parameter_records
+
+# Parameters decoded by `c3d.probing.probe`, other parameters in the file are skipped.
+PROBE_PARAMETERS = (
+    'POINT:USED',
+    'POINT:RATE',
+    'POINT:SCALE',
+    'POINT:LABELS',
+    'POINT:FRAMES',
+    'POINT:LONG_FRAMES',
+    'ANALOG:USED',
+    'ANALOG:RATE',
+    'TRIAL:ACTUAL_START_FIELD',
+    'TRIAL:ACTUAL_END_FIELD',
+)
+
+ProbeRecord = namedtuple('ProbeRecord', [
+    'path',
+    'processor',
+    'point_used',
+    'point_rate',
+    'point_scale',
+    'analog_used',
+    'analog_rate',
+    'first_frame',
+    'last_frame',
+    'frame_count',
+    'point_labels',
+])
+ProbeRecord.__doc__ = '''Summary of the metadata in a .c3d file, see `c3d.probing.probe`.'''
+
+
+class _ProbeManager(Manager):
+    ''' Manager containing the header and a subset of the parameters in a file.
+    '''
+
+    def __init__(self, header, dtypes):
+        super(_ProbeManager, self).__init__(header)
+        self._dtypes = dtypes
+
+
+def probe(path, parameters=True):
+    '''Read a summary of the metadata in a .c3d file.
+
+    Only the header and the parameter section of the file is read, and only the parameters listed in
+    `c3d.probing.PROBE_PARAMETERS` are decoded. File metadata is not validated (in contrast to constructing
+    a `c3d.reader.Reader`).
+
+    Parameters
+    ----------
+    path : str
+        Path to the .c3d file.
+    parameters : bool, default=True
+        If False, the parameter section is not read and the summary is based on the header alone,
+        in which case `point_labels` is None.
+
+    Returns
+    -------
+    record : `c3d.probing.ProbeRecord`
+        Named tuple summarizing the file metadata.
+
+    Raises
+    ------
+    AssertionError
+        If the file is not a .c3d file (the C3D magic value in the header is not matched).
+    '''
+    with open(path, 'rb') as handle:
+        header = Header(handle)
+        # Processor type is stored in the first 4 bytes of the parameter section
+        handle.seek((header.parameter_block - 1) * 512)
+        _, _, parameter_blocks, processor = struct.unpack('BBBB', handle.read(4))
+        dtypes = DataTypes.shared(processor)
+        header._processor_convert(dtypes, handle)
+        manager = _ProbeManager(header, dtypes)
+
+        if parameters:
+            handle.seek((header.parameter_block - 1) * 512)
+            section = memoryview(handle.read(512 * parameter_blocks))
+            param_names = set(key.split(':')[1] for key in PROBE_PARAMETERS)
+            group_names = {}
+            matched = []
+            for group_id, name, start, end in parameter_records(section, dtypes):
+                if group_id < 0:
+                    group_names[-group_id] = name
+                elif name in param_names:
+                    matched.append((group_id, name, start, end))
+            # Group records may follow the parameters in the group.
+            for group_id, name, start, end in matched:
+                group_name = group_names.get(group_id)
+                if group_name is None or '%s:%s' % (group_name, name) not in PROBE_PARAMETERS:
+                    continue
+                group = manager._groups.get(group_id)
+                if group is None:
+                    group = manager._add_group(group_id, group_name)
+                group._data.add_param(name, buffer=section[start:end])
+
+    labels = manager.get('POINT:LABELS')
+    return ProbeRecord(
+        path=path,
+        processor=dtypes.proc_type,
+        point_used=int(manager.point_used),
+        point_rate=float(manager.point_rate),
+        point_scale=float(manager.point_scale),
+        analog_used=int(manager.analog_used),
+        analog_rate=float(manager.analog_rate),
+        first_frame=int(manager.first_frame),
+        last_frame=int(manager.last_frame),
+        frame_count=int(manager.frame_count),
+        point_labels=None if labels is None else tuple(str(label).strip() for label in labels.string_array),
+    )
@@ -1,13 +1,15 @@
 '''Contains the Reader class for reading C3D files.'''
 
-import io
+import os
 import numpy as np
 import struct
 import warnings
 from .manager import Manager
 from .header import Header
 from .dtypes import DataTypes
-from .utils import DEC_to_IEEE_BYTES
+from .layout import DataLayout, data_layout
+from .parameter import parameter_records
+from .utils import CAMERA_COUNT_LUT, DEC_to_IEEE_ARRAY, DEC_to_IEEE_BYTES
 
 
 class Reader(Manager):
@@ -23,7 +25,7 @@ class Reader(Manager):
     ...     print('{0.shape} points in this frame'.format(points))
     '''
 
-    def __init__(self, handle):
+    def __init__(self, handle, mmap=False, lazy=False):
         '''Initialize this C3D file by reading header and parameter data.
 
         Parameters
@@ -33,6 +35,14 @@ class Reader(Manager):
             handle is assumed to be `seek`-able and `read`-able. The handle must
             remain open for the life of the `Reader` instance. The `Reader` does
             not `close` the handle.
+        mmap : bool, default=False
+            If True, the data section of the file is memory mapped rather than read through
+            the handle, see `c3d.reader.Reader.frame_blocks`. The handle must then be a file
+            object backed by a file descriptor (`fileno()`).
+        lazy : bool, default=False
+            If True, parameter names are decoded when the file is opened while the remaining
+            parameter data (descriptor, dimensions and bytes) is decoded from the parameter section
+            the first time the parameter is accessed.
 
         Raises
         ------
@@ -42,58 +52,36 @@ class Reader(Manager):
         super(Reader, self).__init__(Header(handle))
 
         self._handle = handle
-
-        def seek_param_section_header():
-            ''' Seek to and read the first 4 byte of the parameter header section '''
-            self._handle.seek((self._header.parameter_block - 1) * 512)
-            # metadata header
-            return self._handle.read(4)
-
-        # Begin by reading the processor type:
-        buf = seek_param_section_header()
-        _, _, parameter_blocks, processor = struct.unpack('BBBB', buf)
-        self._dtypes = DataTypes(processor)
+        self._mmap = mmap
+        self._data_map = None
+        self._layout = None
+
+        # Read the parameter section in a single call, records are parsed from the buffer
+        self._handle.seek((self._header.parameter_block - 1) * 512)
+        section = memoryview(self._handle.read(4))
+        _, _, parameter_blocks, processor = struct.unpack_from('BBBB', section)
+        self._dtypes = DataTypes.shared(processor)
         # Convert header parameters in accordance with the processor type (MIPS format re-reads the header)
         self._header._processor_convert(self._dtypes, handle)
 
-        # Restart reading the parameter header after parsing processor type
-        buf = seek_param_section_header()
-
-        start_byte = self._handle.tell()
-        endbyte = start_byte + 512 * parameter_blocks - 4
-        while self._handle.tell() < endbyte:
-            chars_in_name, group_id = struct.unpack('bb', self._handle.read(2))
-            if group_id == 0 or chars_in_name == 0:
-                # we've reached the end of the parameter section.
-                break
-            name = self._dtypes.decode_string(self._handle.read(abs(chars_in_name))).upper()
-
-            # Read the byte segment associated with the parameter and create a
-            # separate binary stream object from the data.
-            offset_to_next, = struct.unpack(['<h', '>h'][self._dtypes.is_mips], self._handle.read(2))
-            if offset_to_next == 0:
-                # Last parameter, as number of bytes are unknown,
-                # read the remaining bytes in the parameter section.
-                bytes = self._handle.read(endbyte - self._handle.tell())
-            else:
-                bytes = self._handle.read(offset_to_next - 2)
-            buf = io.BytesIO(bytes)
-
+        self._handle.seek((self._header.parameter_block - 1) * 512)
+        section = memoryview(self._handle.read(512 * parameter_blocks))
+        for group_id, name, start, end in parameter_records(section, self._dtypes):
             if group_id > 0:
                 # We've just started reading a parameter. If its group doesn't
                 # exist, create a blank one. add the parameter to the group.
-                group = super(Reader, self).get(group_id)
+                group = self._groups.get(group_id)
                 if group is None:
                     group = self._add_group(group_id)
-                group.add_param(name, handle=buf)
+                group._data.add_param(name, buffer=section[start:end], lazy=lazy)
             else:
                 # We've just started reading a group. If a group with the
                 # appropriate numerical id exists already (because we've
                 # already created it for a parameter), just set the name of
                 # the group. Otherwise, add a new group.
                 group_id = abs(group_id)
-                size, = struct.unpack('B', buf.read(1))
-                desc = size and buf.read(size) or ''
+                size, = struct.unpack_from('B', section, start)
+                desc = size and section[start + 1:start + 1 + size].tobytes() or ''
                 group = super(Reader, self).get(group_id)
                 if group is not None:
                     self._rename_group(group, name)  # Inserts name key
@@ -103,9 +91,47 @@ class Reader(Manager):
 
         self._check_metadata()
 
-    def read_frames(self, copy=True, analog_transform=True, check_nan=True, camera_sum=False):
+    @classmethod
+    def from_layout(cls, handle, layout, proc_type, mmap=False):
+        '''Create a reader for the data section of a file with a known layout, without reading the header
+        or the parameter section.
+
+        Intended for reading the data of a file whose layout was stored earlier, see
+        `c3d.layout.layout_to_dict`. The reader contains no parameters, point channels to read must then
+        be selected by index or mask rather than by label.
+
+        Parameters
+        ----------
+        handle : file handle
+            Handle to the C3D file, see `c3d.reader.Reader`.
+        layout : `c3d.layout.DataLayout`
+            Layout of the data section in the file.
+        proc_type : int
+            Processor type of the file, see `c3d.reader.Reader.proc_type`.
+        mmap : bool, default=False
+            If True, the data section of the file is memory mapped, see `c3d.reader.Reader`.
+
+        Returns
+        -------
+        reader : `c3d.reader.Reader`
+            Reader with an empty header and no parameters.
+        '''
+        reader = cls.__new__(cls)
+        super(Reader, reader).__init__()
+        reader._handle = handle
+        reader._mmap = mmap
+        reader._data_map = None
+        reader._layout = layout
+        reader._dtypes = DataTypes.shared(proc_type)
+        return reader
+
+    def read_frames(self, copy=True, analog_transform=True, check_nan=True, camera_sum=False,
+                    start=None, stop=None, step=None, include_analog=True, point_channels=None, out=None):
         '''Iterate over the data frames from our C3D file handle.
 
+        Frames are read by seeking directly to the byte offset of each frame in the data section,
+        see `start`, `stop`, and `step` to iterate over a subset of the frames.
+
         Parameters
         ----------
         copy : bool
@@ -122,6 +148,24 @@ class Reader(Manager):
             and residuals will be set to -1.
         camera_sum : bool, default=False
             Camera flag bits will be summed, converting the fifth column to a camera visibility counter.
+        start : int, optional
+            Index of the first frame to read, relative to the first frame in the file (index 0).
+            Negative values index from the end of the data, equivalent to a python slice.
+        stop : int, optional
+            Index of the frame to stop reading at (exclusive), defaults to reading until the last frame.
+        step : int, optional
+            Read every `step`:th frame in the range, frames in between are skipped without being decoded.
+        include_analog : bool, default=True
+            If False, ANALOG data blocks are skipped without being parsed and the analog
+            data returned is an empty array.
+        point_channels : array_like, optional
+            Subset of POINT channels to decode, as an array of channel indices, a boolean mask of
+            length `point_used`, or a sequence of POINT:LABELS strings. Only the selected channels are
+            decoded and returned, in the order given. Defaults to decoding all channels.
+        out : (np.ndarray, np.ndarray), optional
+            Tuple of (points, analog) buffers of shape (npoints, 5) and (analog_used, analog_per_frame)
+            to decode each frame into, either buffer can be None. Provided buffers are reused and yielded
+            for every frame, independent of `copy`.
 
         Returns
         -------
@@ -141,138 +185,527 @@ class Reader(Manager):
             Both the fourth and fifth values are -1 if the point is considered
             to be invalid.
         '''
+        layout = self.layout
         # Point magnitude scalar, if scale parameter is < 0 data is floating point
         # (in which case the magnitude is the absolute value)
-        scale_mag = abs(self.point_scale)
-        is_float = self.point_scale < 0
-
-        if is_float:
-            point_word_bytes = 4
-        else:
-            point_word_bytes = 2
-        points = np.zeros((self.point_used, 5), np.float32)
-
-        # TODO: handle ANALOG:BITS parameter here!
-        p = self.get('ANALOG:FORMAT')
-        analog_unsigned = p and p.string_value.strip().upper() == 'UNSIGNED'
-        if is_float:
-            analog_dtype = self._dtypes.float32
-            analog_word_bytes = 4
-        elif analog_unsigned:
-            # Note*: Floating point is 'always' defined for both analog and point data, according to the standard.
-            analog_dtype = self._dtypes.uint16
-            analog_word_bytes = 2
-            # Verify BITS parameter for analog
-            p = self.get('ANALOG:BITS')
-            if p and p._as_integer_value / 8 != analog_word_bytes:
-                raise NotImplementedError('Analog data using {} bits is not supported.'.format(p._as_integer_value))
-        else:
-            analog_dtype = self._dtypes.int16
-            analog_word_bytes = 2
-
+        scale_mag = abs(layout.point_scale)
+        is_float = layout.is_float
+        point_dtype, analog_dtype = layout.point_dtype, layout.analog_dtype
+
+        channels = self._point_channel_index(point_channels)
+        npoints = layout.point_used if channels is None else len(channels)
+        points_out, analog_out = self._output_buffers(out, None, npoints, include_analog)
+        points = np.zeros((npoints, 5), np.float32) if points_out is None else points_out
+        if analog_out is None and not copy and include_analog:
+            # Reuse a single buffer for the analog data as well
+            analog_out = np.empty((layout.analog_used, layout.analog_per_frame), float)
         analog = np.array([], float)
-        analog_scales, analog_offsets = self.get_analog_transform()
+        analog_scales, analog_offsets = layout.analog_scales, layout.analog_offsets
 
-        # Seek to the start point of the data blocks
-        self._handle.seek((self._header.data_block - 1) * 512)
         # Number of values (words) read in regard to POINT/ANALOG data
-        N_point = 4 * self.point_used
-        N_analog = self.analog_used * self.analog_per_frame
+        point_shape = (layout.point_used, 4)
+        analog_shape = (layout.analog_per_frame, layout.analog_used)
+        N_point = 4 * layout.point_used
+        N_analog = layout.analog_used * layout.analog_per_frame
 
         # Total bytes per frame
-        point_bytes = N_point * point_word_bytes
-        analog_bytes = N_analog * analog_word_bytes
+        point_bytes = layout.point_bytes
+        analog_bytes = layout.analog_bytes
+        frame_bytes = layout.frame_bytes
+        data_offset = layout.data_offset
+
+        # Seek to the start point of the data blocks
+        indices = self._frame_range(start, stop, step)
+        self._handle.seek(data_offset + indices.start * frame_bytes)
         # Parse the data blocks
-        for frame_no in range(self.first_frame, self.last_frame + 1):
+        for index in indices:
+            frame_no = layout.first_frame + index
+            if indices.step != 1:
+                # Seek directly to the frame, skipping the frames in between
+                self._handle.seek(data_offset + index * frame_bytes)
             # Read the byte data (used) for the block
-            raw_bytes = self._handle.read(N_point * point_word_bytes)
-            raw_analog = self._handle.read(N_analog * analog_word_bytes)
+            raw_bytes = self._handle.read(point_bytes)
+            if include_analog:
+                raw_analog = self._handle.read(analog_bytes)
+            else:
+                # Skip over the analog block
+                self._handle.seek(analog_bytes, 1)
+                raw_analog = b''
             # Verify read pointers (any of the two can be assumed to be 0)
             if len(raw_bytes) < point_bytes:
                 warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
-                                 and file pointer {}!'''.format(frame_no - self.first_frame, self._handle.tell()))
+                                 and file pointer {}!'''.format(index, self._handle.tell()))
                 return
-            if len(raw_analog) < analog_bytes:
+            if include_analog and len(raw_analog) < analog_bytes:
                 warnings.warn('''reached end of file (EOF) while reading POINT data at frame index {}
-                                 and file pointer {}!'''.format(frame_no - self.first_frame, self._handle.tell()))
+                                 and file pointer {}!'''.format(index, self._handle.tell()))
                 return
 
-            if is_float:
-                # Convert every 4 byte words to a float-32 reprensentation
-                # (the fourth column is still not a float32 representation)
-                if self._dtypes.is_dec:
-                    # Convert each of the first 6 16-bit words from DEC to IEEE float
-                    points[:, :4] = DEC_to_IEEE_BYTES(raw_bytes).reshape((self.point_used, 4))
-                else:  # If IEEE or MIPS:
-                    # Convert each of the first 6 16-bit words to native float
-                    points[:, :4] = np.frombuffer(raw_bytes,
-                                                  dtype=self._dtypes.float32,
-                                                  count=N_point).reshape((self.point_used, 4))
-
-                # Cast last word to signed integer in system endian format
-                last_word = points[:, 3].astype(np.int32)
-
-            else:
-                # View the bytes as signed 16-bit integers
-                raw = np.frombuffer(raw_bytes,
-                                    dtype=self._dtypes.int16,
-                                    count=N_point).reshape((self.point_used, 4))
-                # Read the first six 16-bit words as x, y, z coordinates
-                points[:, :3] = raw[:, :3] * scale_mag
-                # Cast last word to signed integer in system endian format
-                last_word = raw[:, 3].astype(np.int16)
-
-            # Parse camera-observed bits and residuals.
-            # Notes:
-            # - Invalid sample if residual is equal to -1 (check if word < 0).
-            # - A residual of 0.0 represent modeled data (filtered or interpolated).
-            # - Camera and residual words are always 8-bit (1 byte), never 16-bit.
-            # - If floating point, the byte words are encoded in an integer cast to a float,
-            #    and are written directly in byte form (see the MLS guide).
-            ##
-            # Read the residual and camera byte words (Note* if 32 bit word negative sign is discarded).
-            residual_byte, camera_byte = (last_word & 0x00ff), (last_word & 0x7f00) >> 8
-
-            # Fourth value is floating-point (scaled) error estimate (residual)
-            points[:, 3] = residual_byte * scale_mag
-
-            # Determine invalid samples
-            invalid = last_word < 0
-            if check_nan:
-                is_nan = ~np.all(np.isfinite(points[:, :4]), axis=1)
-                points[is_nan, :3] = 0.0
-                invalid |= is_nan
-            # Update discarded - sign
-            points[invalid, 3] = -1
-
-            # Fifth value is the camera-observation byte
-            if camera_sum:
-                # Convert to observation sum
-                points[:, 4] = sum((camera_byte & (1 << k)) >> k for k in range(7))
-            else:
-                points[:, 4] = camera_byte  # .astype(np.float32)
+            raw = np.frombuffer(raw_bytes, dtype=point_dtype, count=N_point).reshape(point_shape)
+            raw = self._native_words(raw)
+            if channels is not None:
+                # Select the channels before decoding
+                raw = raw[channels]
+            if layout.is_dec:
+                # Convert each of the 32-bit words from DEC to IEEE float
+                raw = DEC_to_IEEE_ARRAY(raw)
+            self._decode_points(raw, points, scale_mag, is_float, check_nan, camera_sum)
 
             # Check if analog data exist, and parse if so
-            if N_analog > 0:
-                if is_float and self._dtypes.is_dec:
-                    # Convert each of the 16-bit words from DEC to IEEE float
+            if include_analog and N_analog > 0:
+                if layout.is_dec:
+                    # Convert each of the 32-bit words from DEC to IEEE float
                     analog = DEC_to_IEEE_BYTES(raw_analog)
                 else:
                     # Integer or INTEL/MIPS floating point data can be parsed directly
-                    analog = np.frombuffer(raw_analog, dtype=analog_dtype, count=N_analog)
+                    analog = self._native_words(np.frombuffer(raw_analog, dtype=analog_dtype, count=N_analog))
 
-                # Reformat and convert
-                analog = analog.reshape((-1, self.analog_used)).T
-                analog = analog.astype(float)
-                # Convert analog
-                analog = (analog - analog_offsets) * analog_scales
+                analog = self._decode_analog(analog.reshape(analog_shape),
+                                             analog_scales, analog_offsets, analog_transform, out=analog_out)
 
             # Output buffers
-            if copy:
+            if copy and points_out is None:
                 yield frame_no, points.copy(), analog  # .copy(), a new array is generated per frame for analog data.
             else:
                 yield frame_no, points, analog
 
+        if len(indices) > 0 and indices[-1] == layout.frame_count - 1:
+            self._check_data_remaining()
+
+    def read_frame(self, index, analog_transform=True, check_nan=True, camera_sum=False, include_analog=True,
+                   point_channels=None, out=None):
+        '''Read and decode a single data frame by seeking directly to its location in the file.
+
+        Parameters
+        ----------
+        index : int
+            Index of the frame to read, relative to the first frame in the file (index 0).
+            Negative values index from the end of the data.
+
+        See `c3d.reader.Reader.read_frames` for remaining arguments.
+
+        Returns
+        -------
+        frame : (frame number, points, analog)
+            Tuple equivalent to a single item generated by `read_frames`.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range or the frame could not be read.
+        '''
+        index = range(self.layout.frame_count)[index]
+        for frame in self.read_frames(copy=True, analog_transform=analog_transform, check_nan=check_nan,
+                                      camera_sum=camera_sum, start=index, stop=index + 1,
+                                      include_analog=include_analog, point_channels=point_channels, out=out):
+            return frame
+        raise IndexError('Frame at index {} could not be read from the data section.'.format(index))
+
+    def read_frames_array(self, analog_transform=True, check_nan=True, camera_sum=False,
+                          start=None, stop=None, step=None, include_analog=True, point_channels=None, out=None):
+        '''Read and decode every data frame in the file as whole-trial arrays.
+
+        The data section is accessed through `frame_blocks`, in a single read call (or as a
+        memory mapped view), and decoded in a few vectorized passes over all frames rather than
+        one frame at a time as in `read_frames`.
+
+        Parameters
+        ----------
+        analog_transform : bool, default=True
+            If True, ANALOG:SCALE, ANALOG:GEN_SCALE, and ANALOG:OFFSET transforms
+            available in the file are applied to the analog channels.
+        check_nan : bool, default=True
+            If True, point x,y,z coordinates with nan values will be marked invalidated
+            and residuals will be set to -1.
+        camera_sum : bool, default=False
+            Camera flag bits will be summed, converting the fifth column to a camera visibility counter.
+            If False, the fifth column holds the camera bit mask, which can be converted to counters
+            with `c3d.utils.camera_count` whenever both are needed.
+        start : int, optional
+            Index of the first frame to read, relative to the first frame in the file (index 0).
+            Negative values index from the end of the data, equivalent to a python slice.
+        stop : int, optional
+            Index of the frame to stop reading at (exclusive), defaults to reading until the last frame.
+        step : int, optional
+            Read every `step`:th frame in the range, frames in between are skipped without being decoded.
+        include_analog : bool, default=True
+            If False, ANALOG data blocks are skipped without being parsed and the analog
+            data returned is an empty array.
+        point_channels : array_like, optional
+            Subset of POINT channels to decode, as an array of channel indices, a boolean mask of
+            length `point_used`, or a sequence of POINT:LABELS strings. Only the selected channels are
+            decoded and returned, in the order given. Defaults to decoding all channels.
+        out : (np.ndarray, np.ndarray), optional
+            Tuple of (points, analog) buffers to decode the frames into, either buffer can be None. Buffers
+            must match the shape of the returned arrays, except for the first dimension which may hold more
+            than `nframes` rows. The returned arrays are views of the first `nframes` rows of each buffer.
+
+        Returns
+        -------
+        frames : np.ndarray
+            Array of shape (nframes,) containing the frame number of each decoded frame.
+        points : np.ndarray
+            Array of shape (nframes, point_used, 5) containing the point data for each frame (or the
+            selected `point_channels`), columns are equivalent to the point data returned by `read_frames`.
+        analog : np.ndarray
+            Array of shape (nframes, analog_used, analog_per_frame) containing the analog samples
+            recorded during each frame (empty if `include_analog` is False).
+        '''
+        indices = self._frame_range(start, stop, step)
+        channels = self._point_channel_index(point_channels)
+        npoints = self.layout.point_used if channels is None else len(channels)
+        points, analog = self._output_buffers(out, len(indices), npoints, include_analog)
+
+        data = self.frame_blocks(start, stop, step, include_analog=include_analog)
+        nframes = len(data)
+        points, analog = self._decode_blocks(data, channels, analog_transform, check_nan, camera_sum, include_analog,
+                                             points=None if points is None else points[:nframes],
+                                             analog=None if analog is None else analog[:nframes])
+
+        frames = self.layout.first_frame + np.arange(indices.start, indices.stop, indices.step)[:len(points)]
+        return frames, points, analog
+
+    def read_frame_chunks(self, chunk_size, copy=True, analog_transform=True, check_nan=True, camera_sum=False,
+                          start=None, stop=None, step=None, include_analog=True, point_channels=None, out=None):
+        '''Iterate over blocks of up to `chunk_size` frames, each decoded as arrays.
+
+        Each block is read through `frame_blocks` and decoded as in `read_frames_array`, bounding the memory
+        used to the size of a block while decoding at a similar rate.
+
+        Parameters
+        ----------
+        chunk_size : int
+            Number of frames in each block, the last block may contain fewer frames.
+        copy : bool, default=True
+            If False, the same output buffers are reused for every block and the arrays yielded are views
+            of the buffers. Set this to False if each block is consumed before the next is read, or True if
+            blocks are stored for later.
+        out : (np.ndarray, np.ndarray), optional
+            Tuple of (points, analog) buffers to decode each block into, either buffer can be None. Buffers
+            must hold at least `chunk_size` frames (or the number of frames in the range if fewer) and are
+            reused for every block, independent of `copy`, see `read_frames_array`.
+
+        See `c3d.reader.Reader.read_frames_array` for remaining arguments.
+
+        Returns
+        -------
+        chunks : sequence of (frames, points, analog)
+            This method generates a sequence of (frames, points, analog) tuples, one tuple per block.
+            Arrays in each tuple are equivalent to the arrays returned by `read_frames_array` for
+            the frames in the block.
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is not a positive integer.
+        '''
+        if chunk_size < 1:
+            raise ValueError('Expected chunk_size to be a positive integer, was {}.'.format(chunk_size))
+        layout = self.layout
+        indices = self._frame_range(start, stop, step)
+        channels = self._point_channel_index(point_channels)
+        npoints = layout.point_used if channels is None else len(channels)
+        chunk_frames = min(chunk_size, len(indices))
+        points, analog = self._output_buffers(out, chunk_frames, npoints, include_analog)
+        if not copy:
+            if points is None:
+                points = np.empty((chunk_frames, npoints, 5), np.float32)
+            if analog is None and include_analog:
+                analog = np.empty((chunk_frames, layout.analog_used, layout.analog_per_frame), float)
+
+        for offset in range(0, len(indices), chunk_size):
+            chunk = indices[offset:offset + chunk_size]
+            data = self.frame_blocks(chunk.start, chunk.stop, chunk.step, include_analog=include_analog)
+            nframes = len(data)
+            chunk_points, chunk_analog = self._decode_blocks(
+                data, channels, analog_transform, check_nan, camera_sum, include_analog,
+                points=None if points is None else points[:nframes],
+                analog=None if analog is None else analog[:nframes])
+            frames = layout.first_frame + np.arange(chunk.start, chunk.stop, chunk.step)[:nframes]
+            yield frames, chunk_points, chunk_analog
+            if nframes < len(chunk):
+                # Reached end of file
+                return
+
+    def frame_blocks(self, start=None, stop=None, step=None, include_analog=True):
+        '''Get the raw POINT and ANALOG data blocks of each frame as a structured array.
+
+        Each element in the array holds the undecoded words of a single frame in two fields:
+        'point' of shape (point_used, 4) and 'analog' of shape (analog_per_frame, analog_used).
+        Words are typed in the byte order of the file (DEC floats are exposed as raw 32-bit words).
+
+        If the reader was created with `mmap=True`, the array is a read-only view of the mapped
+        file and slicing it does not copy or read any data until it's accessed. Otherwise the
+        frames in the range are read into memory, in a single call if `step` is 1.
+
+        Parameters
+        ----------
+        start : int, optional
+            Index of the first frame to read, relative to the first frame in the file (index 0).
+            Negative values index from the end of the data, equivalent to a python slice.
+        stop : int, optional
+            Index of the frame to stop reading at (exclusive), defaults to reading until the last frame.
+        step : int, optional
+            Read every `step`:th frame in the range, frames in between are skipped without being read.
+        include_analog : bool, default=True
+            If False, the 'analog' field is excluded from the array dtype, exposing only a strided
+            view of the POINT words in each frame.
+
+        Returns
+        -------
+        blocks : np.ndarray or np.memmap
+            Structured array of shape (nframes,).
+        '''
+        layout = self.layout
+        block_dtype = layout.block_dtype
+        frame_dtype = block_dtype
+        if not include_analog:
+            # Same record size, but only the point words are exposed
+            frame_dtype = np.dtype({'names': ['point'],
+                                    'formats': [block_dtype.fields['point'][0]],
+                                    'offsets': [0],
+                                    'itemsize': block_dtype.itemsize})
+        indices = self._frame_range(start, stop, step)
+        nframes = len(indices)
+        offset = layout.data_offset
+        frame_bytes = layout.frame_bytes
+        if frame_bytes == 0:
+            return np.empty(nframes, dtype=frame_dtype)
+
+        if self._mmap:
+            if self._data_map is None:
+                file_size = os.fstat(self._handle.fileno()).st_size
+                nmapped = min(layout.frame_count, max(0, file_size - offset) // frame_bytes)
+                if nmapped > 0:
+                    self._data_map = np.memmap(self._handle, dtype=block_dtype, mode='r',
+                                               offset=offset, shape=(nmapped,))
+                else:
+                    self._data_map = np.empty(0, dtype=block_dtype)
+            data = self._data_map[indices.start:indices.stop:indices.step].view(frame_dtype)
+            nread = len(data)
+            if nread > 0:
+                self._handle.seek(offset + (indices[nread - 1] + 1) * frame_bytes)
+        else:
+            data = np.empty(nframes, dtype=frame_dtype)
+            if indices.step == 1:
+                self._handle.seek(offset + indices.start * frame_bytes)
+                nread = self._handle.readinto(data) // frame_bytes
+            else:
+                # Seek to each frame, skipping the frames in between
+                nread = 0
+                for i, index in enumerate(indices):
+                    self._handle.seek(offset + index * frame_bytes)
+                    if self._handle.readinto(data[i:i + 1]) < frame_bytes:
+                        break
+                    nread += 1
+
+        if nread < nframes:
+            warnings.warn('''reached end of file (EOF) while reading data at frame index {}
+                             and file pointer {}!'''.format(indices[nread], self._handle.tell()))
+            return data[:nread]
+        if nframes > 0 and indices[-1] == layout.frame_count - 1:
+            self._check_data_remaining()
+        return data
+
+    def _frame_range(self, start, stop, step):
+        '''Get the range of frame indices, relative to the first frame, matching the slice arguments.
+
+        Raises
+        ------
+        ValueError
+            If `step` is not a positive integer.
+        '''
+        if step is not None and step < 1:
+            raise ValueError('Expected step to be a positive integer, was {}.'.format(step))
+        return range(self.layout.frame_count)[slice(start, stop, step)]
+
+    def _point_channel_index(self, point_channels):
+        '''Convert a POINT channel selection to an array of channel indices (or None if all channels are used).
+
+        Raises
+        ------
+        ValueError
+            If a boolean mask doesn't match the number of channels, or a label is not found in POINT:LABELS.
+        '''
+        if point_channels is None:
+            return None
+        point_used = self.layout.point_used
+        channels = np.asarray(point_channels)
+        if channels.dtype == bool:
+            if channels.shape != (point_used,):
+                raise ValueError('Expected POINT channel mask of shape ({},), was {}.'.format(
+                    point_used, channels.shape))
+            return np.flatnonzero(channels)
+        if channels.dtype.kind in 'USO':
+            labels = [label.strip() for label in self.point_labels[:point_used]]
+            try:
+                return np.array([labels.index(label.strip()) for label in channels.ravel()], dtype=np.intp)
+            except ValueError:
+                missing = [str(label) for label in channels.ravel() if label.strip() not in labels]
+                raise ValueError('POINT label(s) {} not found in POINT:LABELS.'.format(missing))
+        return channels.astype(np.intp).ravel()
+
+    def _output_buffers(self, out, nframes, npoints, include_analog):
+        '''Validate a caller-provided (points, analog) tuple of output buffers.
+
+        Buffers hold a single frame if `nframes` is None, otherwise at least `nframes` frames along the first
+        dimension in which case views of the first `nframes` rows are returned. Missing buffers are None.
+
+        Raises
+        ------
+        ValueError
+            If a buffer is not a writeable floating point array of the expected shape.
+        '''
+        if out is None:
+            return None, None
+        points, analog = out
+        if not include_analog:
+            analog = None
+        layout = self.layout
+        buffers = []
+        for name, buffer, shape in (('points', points, (npoints, 5)),
+                                    ('analog', analog, (layout.analog_used, layout.analog_per_frame))):
+            if buffer is not None:
+                if not isinstance(buffer, np.ndarray) or buffer.dtype.kind != 'f' or not buffer.flags.writeable:
+                    raise ValueError('Expected {} output buffer to be a writeable floating point array.'.format(name))
+                if nframes is None:
+                    valid = buffer.shape == shape
+                else:
+                    valid = buffer.ndim == 3 and buffer.shape[1:] == shape and len(buffer) >= nframes
+                    shape = (nframes,) + shape
+                if not valid:
+                    raise ValueError('Expected {} output buffer of shape {}, was {}.'.format(
+                        name, shape, buffer.shape))
+                if nframes is not None:
+                    buffer = buffer[:nframes]
+            buffers.append(buffer)
+        return tuple(buffers)
+
+    def _decode_blocks(self, data, channels, analog_transform, check_nan, camera_sum, include_analog,
+                       points=None, analog=None):
+        '''Decode a structured array of frame blocks, see `frame_blocks`, into point and analog arrays.
+
+        Words in `data` may be converted in place. Decoded data is written to the `points` and `analog`
+        arrays if given (of shape (nframes, npoints, 5) and (nframes, analog_used, analog_per_frame)).
+        '''
+        layout = self.layout
+        scale_mag = abs(layout.point_scale)
+        data = self._native_words(data)
+        nframes = len(data)
+
+        convert_dec = layout.is_dec
+        if convert_dec and data.flags.writeable and data.flags.c_contiguous:
+            # Every word in the data section is a DEC float, convert the whole section in place
+            words = data.view(np.uint32)
+            DEC_to_IEEE_ARRAY(words, out=words)
+            convert_dec = False
+
+        raw_points = data['point']
+        if channels is not None:
+            # Select the channels before decoding
+            raw_points = raw_points[:, channels]
+        if convert_dec:
+            # Convert each of the 32-bit words from DEC to IEEE float
+            raw_points = DEC_to_IEEE_ARRAY(raw_points)
+        elif layout.is_dec:
+            raw_points = raw_points.view(np.float32)
+
+        if points is None:
+            points = np.empty(raw_points.shape[:2] + (5,), np.float32)
+        self._decode_points(raw_points, points, scale_mag, layout.is_float, check_nan, camera_sum)
+
+        if include_analog:
+            raw_analog = data['analog']
+            if convert_dec:
+                raw_analog = DEC_to_IEEE_ARRAY(raw_analog)
+            elif layout.is_dec:
+                raw_analog = raw_analog.view(np.float32)
+            analog = self._decode_analog(raw_analog, layout.analog_scales, layout.analog_offsets, analog_transform,
+                                         out=analog)
+        else:
+            analog = np.empty((nframes, 0, 0), float)
+        return points, analog
+
+    def _native_words(self, words):
+        '''Convert an array of words from the data section to native byte order, in a single pass.
+
+        Words in files stored in a non-native byte order (MIPS files) are byteswapped in place if
+        the array is writable, or into a new array otherwise. Native arrays are returned as is.
+        '''
+        if words.dtype.isnative:
+            return words
+        native_dtype = words.dtype.newbyteorder('=')
+        if words.flags.writeable:
+            return words.byteswap(inplace=True).view(native_dtype)
+        return words.byteswap().view(native_dtype)
+
+    def _decode_points(self, raw, out, scale_mag, is_float, check_nan, camera_sum):
+        '''Decode raw POINT words of shape (..., point_used, 4) into `out` of shape (..., point_used, 5).
+
+        All frames in `raw` are decoded at once, each column is written directly to `out` without
+        intermediate arrays of the decoded shape.
+        '''
+        coords, residual, cameras = out[..., :3], out[..., 3], out[..., 4]
+        if is_float:
+            # Copy the 4 byte float words for x, y, z coordinates
+            np.copyto(coords, raw[..., :3])
+            # Cast last word to signed integer in system endian format
+            # (the fourth word is still not a float32 representation)
+            last_word = raw[..., 3].astype(np.int32)
+        else:
+            # Scale the first three 16-bit words as x, y, z coordinates
+            np.multiply(raw[..., :3], scale_mag, out=coords, casting='same_kind')
+            # Last word is already a signed integer in system endian format
+            last_word = raw[..., 3]
+
+        # Parse camera-observed bits and residuals.
+        # Notes:
+        # - Invalid sample if residual is equal to -1 (check if word < 0).
+        # - A residual of 0.0 represent modeled data (filtered or interpolated).
+        # - Camera and residual words are always 8-bit (1 byte), never 16-bit.
+        # - If floating point, the byte words are encoded in an integer cast to a float,
+        #    and are written directly in byte form (see the MLS guide).
+        ##
+        # Fourth value is floating-point (scaled) error estimate (residual)
+        np.multiply(np.bitwise_and(last_word, 0xff), scale_mag, out=residual, casting='same_kind')
+        # Read the camera byte word (Note* if 32 bit word negative sign is discarded).
+        camera_byte = np.right_shift(last_word, 8)
+        camera_byte &= 0x7f
+
+        # Determine invalid samples, integer coordinates are always finite
+        invalid = last_word < 0
+        if check_nan and is_float:
+            is_nan = ~np.all(np.isfinite(coords), axis=-1)
+            np.copyto(coords, 0.0, where=is_nan[..., np.newaxis])
+            invalid |= is_nan
+        # Update discarded - sign
+        np.copyto(residual, -1, where=invalid)
+
+        # Fifth value is the camera-observation byte
+        if camera_sum:
+            # Convert to observation sum
+            cameras[...] = CAMERA_COUNT_LUT[camera_byte]
+        else:
+            cameras[...] = camera_byte
+        return out
+
+    def _decode_analog(self, raw, analog_scales, analog_offsets, analog_transform, out=None):
+        '''Decode raw ANALOG words of shape (..., analog_per_frame, analog_used) into
+        float samples of shape (..., analog_used, analog_per_frame), written to `out` if given.
+        '''
+        # Reformat and convert
+        if out is None:
+            analog = np.swapaxes(raw, -1, -2).astype(float)
+        else:
+            analog = out
+            np.copyto(analog, np.swapaxes(raw, -1, -2))
+        if analog_transform:
+            analog -= analog_offsets
+            analog *= analog_scales
+        return analog
+
+    def _check_data_remaining(self):
+        '''Warn if data blocks remain in the file after the last frame was read.'''
         # Function evaluating EOF, note that data section is written in blocks of 512
         final_byte_index = self._handle.tell()
         self._handle.seek(0, 2)  # os.SEEK_END)
@@ -287,6 +720,25 @@ class Reader(Manager):
         '''
         return self._dtypes.proc_type
 
+    @property
+    def layout(self) -> DataLayout:
+        '''Layout of the data section, evaluated from the file metadata once and reused by all read methods.
+
+        See `c3d.layout.data_layout`.
+        '''
+        if self._layout is None:
+            self._layout = data_layout(self, self._dtypes)
+        return self._layout
+
+    @property
+    def byteswapped(self) -> bool:
+        '''True if words in the data section are stored in non-native byte order (MIPS files).
+
+        Data read by `read_frames` and `read_frames_array` is then converted to native byte order in
+        bulk, once per read block, before being decoded.
+        '''
+        return not self._dtypes.native
+
     def to_writer(self, conversion=None):
         ''' Converts the reader to a `c3d.writer.Writer` instance using the conversion mode.
 
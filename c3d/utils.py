@@ -55,6 +55,31 @@ def pack_labels(labels):
     return label_str, label_max_size
 
 
+# Number of bits set in each 7-bit POINT camera mask, i.e. the number of cameras observing the point.
+CAMERA_COUNT_LUT = np.array([bin(mask).count('1') for mask in range(128)], dtype=np.uint8)
+
+
+def camera_count(camera_mask):
+    '''Count the number of cameras contributing to each POINT sample from the camera bit masks.
+
+    Parameters
+    ----------
+    camera_mask : array_like
+        Camera bit masks, such as the fifth column of the point data returned from
+        `c3d.reader.Reader.read_frames_array` with `camera_sum=False`. Only the seven
+        least significant bits are considered.
+
+    Returns
+    -------
+    counts : np.ndarray
+        Array of uint8 of the same shape as the input.
+    '''
+    mask = np.asarray(camera_mask)
+    if mask.dtype.kind not in 'iu':
+        mask = mask.astype(np.intp)
+    return CAMERA_COUNT_LUT[mask & 0x7f]
+
+
 class Decorator(object):
     '''Base class for extending (decorating) a python object.
     '''
@@ -77,13 +102,15 @@ def UNPACK_FLOAT_MIPS(uint_32):
     return struct.unpack('f', struct.pack(">I", uint_32))[0]
 
 
-def DEC_to_IEEE(uint_32):
-    '''Convert the 32 bit representation of a DEC float to IEEE format.
+def DEC_to_IEEE_ARRAY(words, out=None):
+    '''Convert an array of 32 bit words containing DEC floats to IEEE format.
 
     Params:
     ----
-    uint_32 : 32 bit unsigned integer containing the DEC single precision float point bits.
-    Returns : IEEE formated floating point of the same shape as the input.
+    words : Array of 32 bit unsigned integers containing the DEC single precision float point bits.
+    out : Optional contiguous 32 bit array of the same shape as `words` to write the result to. Passing `words`
+          converts the data in place.
+    Returns : IEEE formated float32 view of `out` (a new array if `out` is None).
     '''
     # Follows the bit pattern found:
     # 	http://home.fnal.gov/~yang/Notes/ieee_vs_dec_float.txt
@@ -92,11 +119,6 @@ def DEC_to_IEEE(uint_32):
     # In accodance with the first ref. first & second 16 bit words are placed
     # in a big endian 16 bit word representation, and needs to be inverted.
     # Second reference describe the DEC->IEEE conversion.
-
-    # Warning! Unsure if NaN numbers are managed appropriately.
-
-    # Shuffle the first two bit words from DEC bit representation to an ordered representation.
-    # Note that the most significant fraction bits are placed in the first 7 bits.
     #
     # Below are the DEC layout in accordance with the references:
     # ___________________________________________________________________________________
@@ -110,13 +132,55 @@ def DEC_to_IEEE(uint_32):
     # _______________________________________________________
     # |Bit adress -     ..       - Bit adress | Bit adress - ..
     ####
+    #
+    # A DEC float represents (-1)^s * 0.1f * 2^(e - 128) while an IEEE float represents (-1)^s * 1.f * 2^(e - 127),
+    # equal bit patterns therefore differ by a factor 4 which is adjusted for by decrementing the exponent by 2.
+    # Edge cases:
+    # 1) Exponent 1 & 2 (biased), values are subnormal in IEEE format and the fraction must be shifted instead.
+    # 2) Exponent 0, DEC numbers are 0 or the 'reserved operand' (sign bit set) which is converted to NaN.
+    # DEC format has no infinity or NaN encoding, so exponent 255 converts to a finite number.
+    words = np.asarray(words, dtype=np.uint32)
+    if out is None:
+        out = np.empty(words.shape, dtype=np.uint32)
+    else:
+        out = out.view(np.uint32)
+
+    # Swap the first and last 16 bits, ordering each word as: SIGN-Exponent-Fraction
+    high = np.right_shift(words, 16)
+    np.left_shift(words, 16, out=out)
+    np.bitwise_or(out, high, out=out)
+
+    # Decrement exponent by 2 for all normal numbers (exponent > 2)
+    normal = np.bitwise_and(out, 0x7F800000, out=high) > 0x01000000
+    np.subtract(out, np.uint32(0x01000000), out=out, where=normal)
+
+    if not normal.all():
+        # Rare case, numbers with exponent <= 2 are handled separately
+        flat = out.reshape(-1)
+        small = np.flatnonzero(~normal)
+        bits = flat[small]
+        exp = (bits >> 23) & 0xFF
+        sign = bits & 0x80000000
+        fraction = (bits & 0x007FFFFF) | 0x00800000
+        # Subnormal fraction rounded to nearest even, carry into the exponent produces the smallest normal number
+        shift = np.maximum(3 - exp, 1)
+        half = np.uint32(1) << (shift - 1)
+        fraction = (fraction + (half - 1) + ((fraction >> shift) & 1)) >> shift
+        reserved = np.uint32(0x7FC00000) * (sign != 0)
+        flat[small] = np.where(exp == 0, reserved, sign | fraction)
+
+    return out.view(np.float32)
 
-    # Swap the first and last 16  bits for a consistent alignment of the fraction
-    reshuffled = ((uint_32 & 0xFFFF0000) >> 16) | ((uint_32 & 0x0000FFFF) << 16)
-    # After the shuffle each part are in little-endian and ordered as: SIGN-Exponent-Fraction
-    exp_bits = ((reshuffled & 0xFF000000) - 1) & 0xFF000000
-    reshuffled = (reshuffled & 0x00FFFFFF) | exp_bits
-    return UNPACK_FLOAT_IEEE(reshuffled)
+
+def DEC_to_IEEE(uint_32):
+    '''Convert the 32 bit representation of a DEC float to IEEE format.
+
+    Params:
+    ----
+    uint_32 : 32 bit unsigned integer containing the DEC single precision float point bits.
+    Returns : IEEE formated floating point, see DEC_to_IEEE_ARRAY().
+    '''
+    return float(DEC_to_IEEE_ARRAY(np.array([uint_32], dtype=np.uint32))[0])
 
 
 def DEC_to_IEEE_BYTES(bytes):
@@ -127,28 +191,5 @@ def DEC_to_IEEE_BYTES(bytes):
     bytes : Byte array where every 4 bytes represent a single precision DEC float.
     Returns : IEEE formated floating point of the same shape as the input.
     '''
-
-    # See comments in DEC_to_IEEE() for DEC format definition
-
-    # Reshuffle
-    bytes = memoryview(bytes)
-    reshuffled = np.empty(len(bytes), dtype=np.dtype('B'))
-    reshuffled[::4] = bytes[2::4]
-    reshuffled[1::4] = bytes[3::4]
-    reshuffled[2::4] = bytes[::4]
-    # Decrement exponent by 2, if exp. > 1
-    reshuffled[3::4] = bytes[1::4] + (np.bitwise_and(bytes[1::4], 0x7f) == 0) - 1
-
-    # There are different ways to adjust for differences in DEC/IEEE representation
-    # after reshuffle. Two simple methods are:
-    # 1) Decrement exponent bits by 2, then convert to IEEE.
-    # 2) Convert to IEEE directly and divide by four.
-    # 3) Handle edge cases, expensive in python...
-    # However these are simple methods, and do not accurately convert when:
-    # 1) Exponent < 2 (without bias), impossible to decrement exponent without adjusting fraction/mantissa.
-    # 2) Exponent == 0, DEC numbers are then 0 or undefined while IEEE is not. NaN are produced when exponent == 255.
-    # Here method 1) is used, which mean that only small numbers will be represented incorrectly.
-
-    return np.frombuffer(reshuffled.tobytes(),
-                         dtype=np.float32,
-                         count=int(len(bytes) / 4))
+    raw = np.frombuffer(bytes, dtype=np.uint8)
+    return DEC_to_IEEE_ARRAY(raw[:len(raw) - len(raw) % 4].view(np.uint32))
@@ -43,7 +43,7 @@ class Writer(Manager):
         '''Set minimal metadata for this writer.
 
         '''
-        self._dtypes = DataTypes()  # Only support INTEL format from writing
+        self._dtypes = DataTypes.shared()  # Only support INTEL format from writing
         super(Writer, self).__init__()
 
         # Header properties
@@ -111,10 +111,10 @@ class Writer(Manager):
 
         if is_consume:
             writer._header = reader._header
-            writer._groups = reader._groups
+            writer._set_groups(reader._groups)
         elif is_deep_copy:
             writer._header = copy.deepcopy(reader._header)
-            writer._groups = copy.deepcopy(reader._groups)
+            writer._set_groups(copy.deepcopy(reader._groups))
         elif is_shallow_copy:
             # Only copy header (no groups)
             writer._header = copy.deepcopy(reader._header)
@@ -221,11 +221,15 @@ class Writer(Manager):
             Insert the frame or sequence at the index (the first sequence frame will be inserted at the given `index`).
             Note that the index should be relative to 0 rather then the frame number provided by read_frames()!
         '''
-        sh = np.shape(frames)
-        # Single frame
-        if len(sh) < 2:
-            frames = [frames]
-            sh = np.shape(frames)
+        # Single frame if the first entry is a point array of shape (npoints, 5), point and analog
+        # arrays of each frame in a sequence are not stacked as the shapes differ.
+        if len(frames) == 2:
+            try:
+                single = np.ndim(frames[0]) == 2
+            except ValueError:
+                single = False
+            if single:
+                frames = [frames]
 
         # Check data shapes match
         if len(self._frames) > 0:
@@ -234,7 +238,7 @@ class Writer(Manager):
             for f in frames:
                 if np.shape(f[0]) != psh:
                     raise ValueError(
-                        'Shape of analog data does not previous frames. Expexted shape {}, was {}.'.format(
+                        'Shape of point data does not previous frames. Expexted shape {}, was {}.'.format(
                             str(psh), str(np.shape(f[0]))
                         ))
                 if np.shape(f[1]) != ash:
@@ -244,10 +248,11 @@ class Writer(Manager):
                         ))
 
         # Sequence of invalid shape
-        if sh[1] != 2:
-            raise ValueError(
-                'Expected frame input to be sequence of point and analog pairs on form (None, 2). ' +
-                'Input was of shape {}.'.format(str(sh)))
+        for f in frames:
+            if len(f) != 2:
+                raise ValueError(
+                    'Expected frame input to be sequence of point and analog pairs on form (None, 2). ' +
+                    'Input was of shape {}.'.format(str((len(frames), len(f)))))
 
         if index is not None:
             self._frames[index:index] = frames
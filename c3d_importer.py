@@ -21,11 +21,12 @@
 # pep8 compliancy:
 #   flake8 .\c3d_importer.py
 
-import mathutils
 import bpy
 import os
 import numpy as np
 from .pyfuncs import islist
+from .c3d_pipeline import decode_file, BufferPool
+from .c3d_metadata_cache import MetadataCache
 
 
 def load(operator, context, filepath="",
@@ -39,203 +40,271 @@ def load(operator, context, filepath="",
          fake_user=True,
          interpolation='BEZIER',
          max_residual=0.0,
+         keyframe_tolerance=0.0,
+         frame_start=0,
+         frame_end=-1,
+         frame_step=1,
          include_event_markers=False,
          include_empty_labels=False,
          apply_label_mask=True,
+         use_metadata_cache=True,
          print_file=False,
          perf_mon=True):
+    ''' Import a single .c3d file.
 
-    # Load additional modules/packages once the importer is used
+    The file is decoded by decode_file() and the animation is created by create_animation(), see arguments
+    for the two functions.
+    '''
+    manual_orient = manual_orientation(axis_forward, axis_up) if use_manual_orientation else None
+    cache = MetadataCache() if use_metadata_cache else None
+    data = decode_file(filepath, context.scene.render.fps, manual_orient,
+                       global_scale=global_scale,
+                       adapt_frame_rate=adapt_frame_rate,
+                       max_residual=max_residual,
+                       keyframe_tolerance=keyframe_tolerance,
+                       frame_start=frame_start,
+                       frame_end=frame_end,
+                       frame_step=frame_step,
+                       include_event_markers=include_event_markers,
+                       apply_label_mask=apply_label_mask,
+                       cache=cache,
+                       print_file=print_file,
+                       perf_mon=perf_mon)
+    return create_animation(operator, context, data,
+                            create_armature=create_armature,
+                            bone_size=bone_size,
+                            fake_user=fake_user,
+                            interpolation=interpolation,
+                            include_empty_labels=include_empty_labels,
+                            perf_mon=perf_mon)
+
+
+def load_files(operator, context, filepaths,
+               use_manual_orientation=False,
+               axis_forward='-Z',
+               axis_up='Y',
+               global_scale=1.0,
+               create_armature=True,
+               bone_size=0.02,
+               adapt_frame_rate=True,
+               fake_user=True,
+               interpolation='BEZIER',
+               max_residual=0.0,
+               keyframe_tolerance=0.0,
+               frame_start=0,
+               frame_end=-1,
+               frame_step=1,
+               include_event_markers=False,
+               include_empty_labels=False,
+               apply_label_mask=True,
+               use_metadata_cache=True,
+               print_file=False,
+               perf_mon=True,
+               max_workers=None,
+               max_pending=None):
+    ''' Import a set of .c3d files.
+
+    Files are decoded in a thread pool, while the Blender data for each file is created on the calling thread in
+    the order of 'filepaths'. Only reading the files and the NumPy decoding of the data release the GIL, parsing
+    parameters and labels is pure Python and does not run in parallel with other threads. The number of files
+    decoded ahead of the file being created is therefore limited by 'max_pending' rather than the pool size,
+    bounding the memory held by decoded files. Decoded samples are stored in buffers reused for later files once
+    the Blender data is created.
+
+    Params:
+    -----
+    filepaths:      List of file paths to import.
+    max_workers:    Maximum number of threads used to decode files, if None the ThreadPoolExecutor default is used.
+    max_pending:    Maximum number of files decoded, or decoded and waiting to be created, at any time. If None
+                    the number of CPUs is used, up to a maximum of 4.
+    Returns:        List of file paths that could not be imported. The traceback for any exception is printed.
+    '''
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    import traceback
+
+    # Access Blender state on the calling thread.
+    manual_orient = manual_orientation(axis_forward, axis_up) if use_manual_orientation else None
+    fps = context.scene.render.fps
+    cache = MetadataCache() if use_metadata_cache else None
+    buffer_pool = BufferPool()
+    if max_pending is None:
+        max_pending = min(4, os.cpu_count() or 1)
+    max_pending = max(1, max_pending)
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def submit(filepath):
+            return executor.submit(decode_file, filepath, fps, manual_orient,
+                                   global_scale=global_scale,
+                                   adapt_frame_rate=adapt_frame_rate,
+                                   max_residual=max_residual,
+                                   keyframe_tolerance=keyframe_tolerance,
+                                   frame_start=frame_start,
+                                   frame_end=frame_end,
+                                   frame_step=frame_step,
+                                   include_event_markers=include_event_markers,
+                                   apply_label_mask=apply_label_mask,
+                                   cache=cache,
+                                   buffer_pool=buffer_pool,
+                                   print_file=print_file,
+                                   perf_mon=perf_mon)
+
+        futures = deque(submit(filepath) for filepath in filepaths[:max_pending])
+        for i, filepath in enumerate(filepaths):
+            future = futures.popleft()
+            if i + max_pending < len(filepaths):
+                futures.append(submit(filepaths[i + max_pending]))
+            data = None
+            try:
+                data = future.result()
+                msg = create_animation(operator, context, data,
+                                       create_armature=create_armature,
+                                       bone_size=bone_size,
+                                       fake_user=fake_user,
+                                       interpolation=interpolation,
+                                       include_empty_labels=include_empty_labels,
+                                       perf_mon=perf_mon)
+                if msg != {'FINISHED'}:
+                    failed.append(filepath)
+            except Exception:
+                print('')
+                traceback.print_exc()
+                print('')
+                failed.append(filepath)
+            finally:
+                if data is not None:
+                    data.release()
+    return failed
+
+
+def manual_orientation(axis_forward='-Z', axis_up='Y'):
+    ''' Get the orientation matrix converting from the specified axis convention, as a 3x3 numpy array.
+    '''
     from bpy_extras.io_utils import axis_conversion
+    return np.array(axis_conversion(from_forward=axis_forward, from_up=axis_up))
+
+
+def create_animation(operator, context, data,
+                     create_armature=True,
+                     bone_size=0.02,
+                     fake_user=True,
+                     interpolation='BEZIER',
+                     include_empty_labels=False,
+                     perf_mon=True):
+    ''' Create an action (and armature) from a decoded file, must be called from the main thread.
+
+    Params:
+    -----
+    data:           DecodedFile instance returned from decode_file().
+    interpolation:  Keyframe interpolation mode, LINEAR is used if keyframes were reduced (see reduce_keyframes()).
+    Returns:        {'FINISHED'} or {'CANCELLED'}.
+    '''
     from bpy_extras import anim_utils
-    from .c3d_parse_dictionary import C3DParseDictionary
     from . import perfmon
 
-    # Define the action id from the filename
-    file_id = os.path.basename(filepath)
-    file_name = os.path.splitext(file_id)[0]
+    # Forward messages from decoding the file.
+    for type, message in data.reports:
+        operator.report(type, message)
+    if data.cancelled:
+        return {'CANCELLED'}
 
     # Monitor performance
     perfmon = perfmon.new_monitor(print_output=perf_mon)
-    perfmon.level_up('Importing: %s ...' % file_id, True)
-
-    # Open file and read .c3d parameter headers
-    with C3DParseDictionary(filepath) as parser:
-        if print_file:
-            parser.print_file()
-        if parser.reader.point_used == 0:
-            operator.report({'WARNING'}, 'No POINT data in file: %s' % filepath)
-            return {'CANCELLED'}
-
-        # Factor converting .
-        conv_fac_frame_rate = 1.0
-        if adapt_frame_rate:
-            conv_fac_frame_rate = bpy.context.scene.render.fps / parser.frame_rate
-
-        # Conversion factor for length measurements.
-        blend_units = 'm'
-        conv_fac_spatial_unit = parser.unit_conversion('POINT', sys_unit=blend_units)
-
-        # World orientation adjustment.
-        scale = global_scale * conv_fac_spatial_unit
-        if use_manual_orientation:
-            global_orient = axis_conversion(from_forward=axis_forward, from_up=axis_up)
-            global_orient = global_orient @ mathutils.Matrix.Scale(scale, 3)
-            # Convert orientation to a numpy array (3x3 rotation matrix).
-            global_orient = np.array(global_orient)
-        else:
-            global_orient, parsed_screen_param = parser.axis_interpretation([0, 0, 1], [0, 1, 0])
-            global_orient *= scale  # Uniformly scale the axis.
-
-            if not parsed_screen_param:
-                operator.report({'INFO'}, 'Unable to parse X/Y_SCREEN information for POINT data, ' +
-                                          'manual adjustment to orientation may be necessary.')
-
-        # Read labels, remove labels matching hard-coded criteria
-        # regarding the software used to generate the file.
-        labels = parser.point_labels()
-        if apply_label_mask:
-            point_mask = parser.generate_label_mask(labels, 'POINT')
-        else:
-            point_mask = np.ones(np.shape(labels), bool)
-        labels = C3DParseDictionary.make_labels_unique(labels[point_mask])
-        # Equivalent to the number of channels used in POINT data.
-        nlabels = len(labels)
-        if nlabels == 0:
-            operator.report({'WARNING'}, 'All POINT data was culled in file: %s' % filepath)
-            return {'CANCELLED'}
-
-        # Number of frames [first, last] => +1.
-        # first_frame is the frame index to start parsing from.
-        # nframes is the number of frames to parse.
-        first_frame = parser.first_frame
-        nframes = parser.last_frame - first_frame + 1
-        perfmon.message('Parsing: %i frames...' % nframes)
-
-        # 1. Create an action to hold keyframe data.
-        # 2. Generate location (x,y,z) F-Curves for each label.
-        # 3. Format the curve list in sets of 3, each set associate with the x/y/z channels.
-        action, slot = create_action_with_slot(file_name, fake_user=fake_user)
-        channelbag = anim_utils.action_ensure_channelbag_for_slot(action, slot)
-        blen_curves_arr = generate_blend_curves(channelbag, labels, 3, 'pose.bones["%s"].location')
-        blen_curves = np.array(blen_curves_arr).reshape(nlabels, 3)
-
-        # Load
-        read_data(parser, blen_curves, labels, point_mask, global_orient,
-                  first_frame, nframes, conv_fac_frame_rate,
-                  interpolation, max_residual,
-                  perfmon)
-
-        # Remove labels with no valid keyframes.
-        if not include_empty_labels:
-            clean_empty_fcurves(channelbag)
-        if len(channelbag.fcurves) == 0:
-            remove_action(action)
-            # All samples were either invalid or was previously culled in regard to the channel label.
-            operator.report({'WARNING'}, 'No valid POINT data in file: %s' % filepath)
-            return {'CANCELLED'}
-        # Since we inserted our keyframes in 'FAST' mode, its best to update the fcurves now.
-        for fc in channelbag.fcurves:
-            fc.update()
-
-        # Parse events in the file (if specified).
-        if include_event_markers:
-            read_events(operator, parser, action, conv_fac_frame_rate)
-
-        # Create an armature matching keyframed data (if specified).
-        arm_obj = None
-        bone_radius = bone_size * 0.5
-        if create_armature:
-            final_labels = [fc_grp.name for fc_grp in channelbag.groups]
-            arm_obj = create_armature_object(context, file_name, 'BBONE')
-            add_empty_armature_bones(context, arm_obj, final_labels, bone_size)
-            # Set the width of the bbones.
-            for bone in arm_obj.data.bones:
-                bone.bbone_x = bone_radius
-                bone.bbone_z = bone_radius
-            # Set the created action as active for the armature.
-            set_action_slot(arm_obj, action, slot, replace=False)
-
-        perfmon.level_down("Import finished.")
-
-        bpy.context.view_layer.update()
-        return {'FINISHED'}
-
-
-def read_events(operator, parser, action, conv_fac_frame_rate):
-    ''' Read events from the loaded c3d file and add them as 'pose_markers' to the action.
-    '''
-    try:
-        for (frame, label) in parser.events():
-            marker = action.pose_markers.new(label)
-            marker.frame = int(np.round(frame * conv_fac_frame_rate))
-    except ValueError as e:
-        operator.report({'WARNING'}, str(e))
-    except TypeError as e:
-        operator.report({'WARNING'}, str(e))
-
-
-def read_data(parser, blen_curves, labels, point_mask, global_orient,
-              first_frame, nframes, conv_fac_frame_rate,
-              interpolation, max_residual,
-              perfmon):
-    '''   Read valid POINT data from the file and create action keyframes.
-    '''
-    nlabels = len(labels)
+    perfmon.level_up('Importing: %s ...' % os.path.basename(data.filepath), True)
 
-    # Generate numpy arrays to store POINT data from each frame before creating keyframes.
-    point_frames = np.zeros([nframes, 3, nlabels], dtype=np.float32)
-    valid_samples = np.empty([nframes, nlabels], dtype=bool)
-
-    ##
-    # Start reading POINT blocks (and analog, but analog signals from force plates etc. are not supported).
-    perfmon.level_up('Reading POINT data..', True)
-    for i, points, analog in parser.reader.read_frames(copy=False):
-        index = i - first_frame
-        # Apply masked samples.
-        points = points[point_mask]
-        # Determine valid samples
-        valid = points[:, 3] >= 0.0
-        if max_residual > 0.0:
-            valid = np.logical_and(points[:, 3] < max_residual, valid)
-        valid_samples[index] = valid
-
-        # Extract position coordinates from columns 0:3.
-        point_frames[index] = points[:, :3].T
-
-    # Re-orient and scale the data.
-    point_frames = np.matmul(global_orient, point_frames)
-
-    perfmon.level_down('Reading Done.')
+    # 1. Create an action to hold keyframe data.
+    # 2. Generate location (x,y,z) F-Curves for each label.
+    # 3. Format the curve list in sets of 3, each set associate with the x/y/z channels.
+    nlabels = len(data.labels)
+    action, slot = create_action_with_slot(data.file_name, fake_user=fake_user)
+    channelbag = anim_utils.action_ensure_channelbag_for_slot(action, slot)
+    blen_curves_arr = generate_blend_curves(channelbag, data.labels, 3, 'pose.bones["%s"].location')
+    blen_curves = np.array(blen_curves_arr).reshape(nlabels, 3)
 
     ##
     # Time to generate keyframes.
     perfmon.level_up('Keyframing POINT data..', True)
+    if data.reduced:
+        # Reduced keyframes only reproduce the samples within the tolerance if linearly interpolated.
+        interpolation = 'LINEAR'
+    create_keyframes(blen_curves, data.frame_times, data.point_frames, data.valid_samples, interpolation)
+    perfmon.level_down('Keyframing Done.')
+
+    # Remove labels with no valid keyframes.
+    if not include_empty_labels:
+        clean_empty_fcurves(channelbag)
+    if len(channelbag.fcurves) == 0:
+        remove_action(action)
+        # All samples were either invalid or was previously culled in regard to the channel label.
+        operator.report({'WARNING'}, 'No valid POINT data in file: %s' % data.filepath)
+        return {'CANCELLED'}
+    # Since we inserted our keyframes in 'FAST' mode, its best to update the fcurves now.
+    for fc in channelbag.fcurves:
+        fc.update()
+
+    # Add events as pose markers.
+    for (frame, label) in data.events:
+        marker = action.pose_markers.new(label)
+        marker.frame = frame
+
+    # Create an armature matching keyframed data (if specified).
+    arm_obj = None
+    bone_radius = bone_size * 0.5
+    if create_armature:
+        final_labels = [fc_grp.name for fc_grp in channelbag.groups]
+        arm_obj = create_armature_object(context, data.file_name, 'BBONE')
+        add_empty_armature_bones(context, arm_obj, final_labels, bone_size)
+        # Set the width of the bbones.
+        for bone in arm_obj.data.bones:
+            bone.bbone_x = bone_radius
+            bone.bbone_z = bone_radius
+        # Set the created action as active for the armature.
+        set_action_slot(arm_obj, action, slot, replace=False)
+
+    perfmon.level_down("Import finished.")
+
+    bpy.context.view_layer.update()
+    return {'FINISHED'}
+
+
+def create_keyframes(blen_curves, frame_times, point_frames, valid_samples, interpolation='BEZIER'):
+    ''' Insert keyframes for valid samples, each keyframe attribute is written with a single
+        foreach_set() call for each F-Curve.
+
+    Params:
+    -----
+    blen_curves:    Array of F-Curves with shape (nlabels, 3), one curve for each x/y/z channel of a label.
+    frame_times:    Keyframe time for each sample frame, shape (nframes,).
+    point_frames:   Sample coordinates, shape (nframes, nlabels, 3).
+    valid_samples:  Boolean mask for samples to keyframe, shape (nframes, nlabels).
+    interpolation:  Keyframe interpolation mode.
+    '''
     # Number of valid keys for each label.
     nkeys = np.sum(valid_samples, axis=0)
-    frame_range = np.arange(0, nframes)
+    # Interpolation is written as enum values, Bezier is default and don't need to be set.
+    interp_values = None
+    if interpolation != 'BEZIER':
+        interp_value = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items[interpolation].value
+        interp_values = np.full(np.max(nkeys, initial=0), interp_value, dtype=np.int32)
+
     # Iterate each group (tracker label).
     for label_ind, fc_set in enumerate(blen_curves):
-        # Create keyframes.
+        label_valid = valid_samples[:, label_ind]
         nlabel_keys = nkeys[label_ind]
-        for fc in fc_set:
-            fc.keyframe_points.add(nlabel_keys)
-
-        # Iterate valid frames and insert keyframes.
-        frame_indices = frame_range[valid_samples[:, label_ind]]
+        # Keyframe coordinates for the x/y/z curves, shape (3, nkeys, 2).
+        co = np.empty((3, nlabel_keys, 2), dtype=np.float32)
+        co[:, :, 0] = frame_times[label_valid]
+        co[:, :, 1] = point_frames[label_valid, label_ind].T
         for dim, fc in enumerate(fc_set):
-            keyframes = np.empty((nlabel_keys, 2), dtype=np.float32)
-            keyframes[:, 0] = frame_indices * conv_fac_frame_rate
-            keyframes[:, 1] = point_frames[frame_indices, dim, label_ind]
-            fc.keyframe_points.foreach_set('co', keyframes.ravel())
-
-    if interpolation != 'BEZIER':  # Bezier is default
-        for label_ind, fc_set in enumerate(blen_curves):
-            for fc in fc_set:
-                for kf in fc.keyframe_points:
-                    kf.interpolation = interpolation
-
-    perfmon.level_down('Keyframing Done.')
+            keyframes = co[dim].ravel()
+            fc.keyframe_points.add(nlabel_keys)
+            fc.keyframe_points.foreach_set('co', keyframes)
+            # Handles are placed on the keyframe, and recalculated when the F-Curve is updated.
+            fc.keyframe_points.foreach_set('handle_left', keyframes)
+            fc.keyframe_points.foreach_set('handle_right', keyframes)
+            if interp_values is not None:
+                fc.keyframe_points.foreach_set('interpolation', interp_values[:nlabel_keys])
 
 
 def create_action_with_slot(action_name, slot_name=None, object=None, fake_user=False):
@@ -266,7 +335,6 @@ def create_action_with_slot(action_name, slot_name=None, object=None, fake_user=
     return action, slot
 
 
-
 def remove_action(action):
     ''' Delete a specific action.
     '''
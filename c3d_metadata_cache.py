@@ -0,0 +1,183 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  io_anim_c3d is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Script copyright (C) Mattias Fredriksson
+
+# pep8 compliancy:
+#   flake8 .\c3d_metadata_cache.py
+
+import os
+import json
+import sqlite3
+
+###############
+# Persistent cache for metadata interpreted from .c3d files
+###############
+
+
+def default_cache_directory():
+    ''' Get the per-user directory used to store the cache.
+
+    The Blender cache directory is used if available, otherwise the user cache directory of the system
+    (XDG_CACHE_HOME or ~/.cache).
+    '''
+    try:
+        import bpy
+        return os.path.join(bpy.utils.user_resource('CACHE'), 'io_anim_c3d')
+    except (ImportError, AttributeError, TypeError, ValueError):
+        pass
+    directory = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(directory, 'io_anim_c3d')
+
+
+class MetadataCache:
+    ''' On-disk cache storing metadata interpreted from .c3d files, see C3DParseDictionary.
+
+    Entries are stored as JSON in a sqlite database, keyed by the absolute file path. An entry is only
+    valid while the size and modification time of the file match the values recorded with the entry.
+    Each operation opens a separate connection, so a cache can be shared between threads.
+
+    The cache is only an optimization: if the database can't be created, read or written (e.g. due to
+    permissions or a locked database), operations fail silently and reads are treated as cache misses.
+    '''
+    # Increment when the format of cached metadata changes, invalidating existing entries.
+    VERSION = 1
+
+    def __init__(self, directory=None, timeout=1.0):
+        ''' Open (or create) a metadata cache.
+
+        Params:
+        ----
+        directory:  Directory to store the cache database in, if None the per-user directory given by
+                    default_cache_directory() is used.
+        timeout:    Seconds to wait for a database locked by another connection, before giving up.
+        '''
+        if directory is None:
+            directory = default_cache_directory()
+        self.db_path = os.path.join(directory, 'metadata.sqlite')
+        self.timeout = timeout
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with self._connect() as db:
+                if db.execute('PRAGMA user_version').fetchone()[0] != MetadataCache.VERSION:
+                    db.execute('DROP TABLE IF EXISTS metadata')
+                    db.execute('PRAGMA user_version = %i' % MetadataCache.VERSION)
+                db.execute('CREATE TABLE IF NOT EXISTS metadata ('
+                           'path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, data TEXT)')
+        except (sqlite3.Error, OSError):
+            # Cache is unavailable.
+            self.db_path = None
+
+    @property
+    def available(self):
+        ''' True if the cache database could be opened. '''
+        return self.db_path is not None
+
+    def _connect(self):
+        ''' Open a connection to the cache database.
+        '''
+        return _Connection(sqlite3.connect(self.db_path, timeout=self.timeout))
+
+    @staticmethod
+    def file_key(file_path):
+        ''' Get the (path, size, modification time) triplet identifying the state of a file.
+        '''
+        stat = os.stat(file_path)
+        return os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns
+
+    def get(self, file_path):
+        ''' Get metadata cached for a file.
+
+        Params:
+        ----
+        file_path:  Path to the .c3d file.
+        Returns:    Dictionary with cached metadata, or None if no valid entry exists for the file (or the
+                    cache could not be read).
+        '''
+        if not self.available:
+            return None
+        try:
+            path, size, mtime_ns = MetadataCache.file_key(file_path)
+            with self._connect() as db:
+                row = db.execute('SELECT size, mtime_ns, data FROM metadata WHERE path = ?', (path,)).fetchone()
+            if row is None or row[0] != size or row[1] != mtime_ns:
+                return None
+            return json.loads(row[2])
+        except (sqlite3.Error, OSError, ValueError):
+            return None
+
+    def put(self, file_path, metadata):
+        ''' Store metadata for a file, replacing any existing entry.
+
+        Params:
+        ----
+        file_path:  Path to the .c3d file.
+        metadata:   JSON serializable dictionary.
+        Returns:    True if the entry was stored.
+        '''
+        if not self.available:
+            return False
+        try:
+            path, size, mtime_ns = MetadataCache.file_key(file_path)
+            data = json.dumps(metadata)
+            with self._connect() as db:
+                db.execute('INSERT OR REPLACE INTO metadata (path, size, mtime_ns, data) VALUES (?, ?, ?, ?)',
+                           (path, size, mtime_ns, data))
+        except (sqlite3.Error, OSError):
+            return False
+        return True
+
+    def remove(self, file_path):
+        ''' Remove the entry for a file.
+        '''
+        if not self.available:
+            return
+        try:
+            with self._connect() as db:
+                db.execute('DELETE FROM metadata WHERE path = ?', (os.path.abspath(file_path),))
+        except (sqlite3.Error, OSError):
+            pass
+
+    def clear(self):
+        ''' Remove all entries in the cache.
+        '''
+        if not self.available:
+            return
+        try:
+            with self._connect() as db:
+                db.execute('DELETE FROM metadata')
+        except (sqlite3.Error, OSError):
+            pass
+
+
+class _Connection:
+    ''' Context manager committing and closing a sqlite connection on exit.
+    '''
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self.connection
+
+    def __exit__(self, exc_type, exc_value, tb):
+        try:
+            if exc_type is None:
+                self.connection.commit()
+        finally:
+            self.connection.close()
@@ -22,8 +22,12 @@
 #   flake8 .\c3d_parse_dictionary.py
 
 import sys
+import hashlib
+import inspect
+import functools
 import numpy as np
 from .c3d import Reader
+from .c3d.layout import layout_from_dict, layout_to_dict
 
 ###############
 # Standalone module to interface with the parser for the .c3d format
@@ -36,6 +40,59 @@ def islist(N):
     return hasattr(N, '__len__') and (not isinstance(N, str))
 
 
+def memoized(function):
+    ''' Decorator memoizing the value returned from a C3DParseDictionary method for each set of arguments.
+
+    Returned arrays are set as readonly as the same instance is returned for repeated calls. Memoized values
+    are cleared by C3DParseDictionary.invalidate().
+
+    The decorated method must take (group_id, param_id) as the first arguments, where param_id can be a list of
+    ids. Values are memoized as (method name, group id, param id(s), remaining arguments...), with the ids in
+    upper case, independent of arguments being passed by position or keyword.
+    '''
+    name = function.__name__
+    signature = inspect.signature(function)
+
+    def hashable(arg):
+        # Lists are converted to tuples to be hashable.
+        return tuple(arg) if isinstance(arg, list) else arg
+
+    def normalized_key(self, args, kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        group_id, param_id, *other = list(bound.arguments.values())[1:]
+        if islist(param_id):
+            param_id = tuple(pid.upper() for pid in param_id)
+        else:
+            param_id = param_id.upper()
+        return (name, group_id.upper(), param_id) + tuple(hashable(arg) for arg in other)
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        # Arguments as passed are mapped to the normalized key, which is only evaluated on the first call.
+        if not kwargs:
+            try:
+                return self._memo[self._memo_keys[(name,) + args]]
+            except (KeyError, TypeError):
+                pass
+        call_key = (name,) + tuple(hashable(arg) for arg in args)
+        if kwargs:
+            call_key += tuple(sorted((k, hashable(v)) for k, v in kwargs.items()))
+        key = self._memo_keys.get(call_key)
+        if key is None:
+            key = self._memo_keys[call_key] = normalized_key(self, args, kwargs)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        value = function(self, *args, **kwargs)
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+        self._memo[key] = value
+        return value
+    return wrapper
+
+
 def dim(X):
     ''' Get the number of dimensions of the python array X
     '''
@@ -54,10 +111,27 @@ class C3DParseDictionary:
     Dictionary for dynamically managing .c3d files.
 
     '''
-    def __init__(self, file_path, parse_dict='basic'):
+    def __init__(self, file_path, parse_dict='basic', cache=None):
         ''' Construct a parser for a .c3d file
+
+        Params:
+        ----
+        file_path:  Path to the .c3d file.
+        parse_dict: Dictionary of parameter parsing functions, 'basic' uses define_basic_dictionary().
+        cache:      Optional MetadataCache, metadata interpreted from the file is fetched from and stored to
+                    the cache. If all metadata used is cached, the parameter section of the file is never parsed
+                    and data is read through data_reader using the cached layout of the data section.
         '''
         self.file_path = file_path
+        self.file_handle = None
+        self.cache = cache
+        self._reader = None
+        self._data_reader = None
+        self._metadata = {}
+        self._metadata_changed = False
+        self._modified = False
+        self._memo = {}
+        self._memo_keys = {}
         # Set parse dictionary
         if parse_dict == 'basic':
             self.parse_dict = C3DParseDictionary.define_basic_dictionary()
@@ -73,7 +147,8 @@ class C3DParseDictionary:
     def __enter__(self):
         # Open file handle and create a .c3d reader
         self.file_handle = open(self.file_path, 'rb')
-        self.reader = Reader(self.file_handle)
+        if self.cache is not None:
+            self._metadata = self.cache.get(self.file_path) or {}
         return self
 
     def __exit__(self, exc_type, exc_value, tb):
@@ -84,12 +159,103 @@ class C3DParseDictionary:
         '''
         if self.file_handle and not self.file_handle.closed:
             self.file_handle.close()
+        # Store metadata interpreted from the file.
+        if self._metadata_changed:
+            self._metadata_changed = False
+            self.cache.put(self.file_path, self._metadata)
+
+    @property
+    def reader(self):
+        ''' Get the .c3d reader, the reader is created when first accessed.
+        '''
+        if self._reader is None:
+            # Parameters are decoded when accessed, only a subset of the parameters are used when importing.
+            self._reader = Reader(self.file_handle, lazy=True)
+        return self._reader
+
+    @property
+    def data_reader(self):
+        ''' Get a .c3d reader for reading the data section of the file.
+
+        If the layout of the data section is cached, the returned reader is created from the cached layout
+        without parsing the header or parameters (and can't be used to access parameters). Otherwise the
+        layout is evaluated by the reader and stored in the cache.
+        '''
+        if self._data_reader is None:
+            if self._reader is None and 'data_layout' in self._metadata:
+                proc_type, layout = self._metadata['data_layout']
+                self._data_reader = Reader.from_layout(self.file_handle, layout_from_dict(layout), proc_type)
+            else:
+                self._data_reader = self.reader
+                self.store_metadata('data_layout', [self.reader.proc_type, layout_to_dict(self.reader.layout)])
+        return self._data_reader
+
+    def store_metadata(self, key, value):
+        ''' Store metadata interpreted from the file in the cache (if a cache is used).
+
+        Metadata is not stored once invalidate() was called, as values interpreted from modified parameters
+        don't describe the file.
+
+        Params:
+        ----
+        key:    Key identifying the metadata, including any arguments used to interpret the value.
+        value:  JSON serializable value.
+        '''
+        if self.cache is not None and not self._modified:
+            self._metadata[key] = value
+            self._metadata_changed = True
 
     def get_group(self, group_id):
         ''' Get a group from a group name id
         '''
         return self.reader.get(group_id, None)
 
+    def invalidate(self, group_id=None, param_id=None):
+        ''' Clear memoized parameters and values parsed from parameters.
+
+        Should be called if parameters of the reader are modified, as parameters are only fetched and
+        parsed once. Metadata interpreted from the parameters (such as point_labels()) is cleared on any
+        call and is no longer fetched from, or stored to, the cache.
+
+        Params:
+        ----
+        group_id:   If specified, only values memoized for the group are cleared.
+        param_id:   If specified, only values memoized for parameters matching the id (or extended ids such as
+                    LABELS2 for LABELS) are cleared.
+        '''
+        # Interpreted metadata can depend on any parameter.
+        self._metadata = {}
+        self._metadata_changed = False
+        self._data_reader = None
+        self._modified = True
+        if group_id is None and param_id is None:
+            self._memo.clear()
+            self._memo_keys.clear()
+            return
+        if group_id is not None:
+            group_id = group_id.upper()
+        if param_id is not None:
+            param_id = param_id.upper()
+
+        def extends(pid, base):
+            # True if pid is equal to base, or an extended id such as LABELS2 for LABELS.
+            return pid.startswith(base) and (len(pid) == len(base) or pid[len(base):].isdigit())
+
+        def match(key):
+            group, param = key[1], key[2]
+            if group_id is not None and group != group_id:
+                return False
+            if param_id is None:
+                return True
+            if key[0] == 'parse_multi_parameter':
+                # Values parsed from multiple entries, including extended ids of each id.
+                bases = param if isinstance(param, tuple) else (param,)
+                return any(extends(param_id, base) for base in bases)
+            return extends(param, param_id)
+        for key in [key for key in self._memo if match(key)]:
+            del self._memo[key]
+
+    @memoized
     def get_param(self, group_id, param_id):
         ''' Fetch a parameter struct from group and param id:s
         '''
@@ -104,17 +270,35 @@ class C3DParseDictionary:
     @property
     def first_frame(self):
         ''' Get index of the first recorded frame. '''
-        return self.reader.first_frame
+        if 'first_frame' not in self._metadata:
+            self.store_metadata('first_frame', int(self.reader.first_frame))
+            return self.reader.first_frame
+        return self._metadata['first_frame']
 
     @property
     def last_frame(self):
         ''' Get index of the last recorded frame. '''
-        return self.reader.last_frame
+        if 'last_frame' not in self._metadata:
+            self.store_metadata('last_frame', int(self.reader.last_frame))
+            return self.reader.last_frame
+        return self._metadata['last_frame']
 
     @property
     def frame_rate(self):
         ''' Get the frame rate for the data sequence. '''
-        return max(1.0, self.reader.header.frame_rate)
+        if 'frame_rate' not in self._metadata:
+            frame_rate = max(1.0, self.reader.header.frame_rate)
+            self.store_metadata('frame_rate', float(frame_rate))
+            return frame_rate
+        return self._metadata['frame_rate']
+
+    @property
+    def point_used(self):
+        ''' Get the number of POINT channels used. '''
+        if 'point_used' not in self._metadata:
+            self.store_metadata('point_used', int(self.reader.point_used))
+            return self.reader.point_used
+        return self._metadata['point_used']
 
     """
     --------------------------------------------------------
@@ -162,7 +346,7 @@ class C3DParseDictionary:
 
             # Combine label array with label context and return.
             if context is not None:
-                labels = labels + '_' + context
+                labels = np.char.add(np.char.add(labels, '_'), context)
             return zip(frame_timings, labels)
 
     def axis_interpretation(self, sys_axis_up=[0, 0, 1], sys_axis_forw=[0, 1, 0]):
@@ -174,6 +358,11 @@ class C3DParseDictionary:
         sys_axis_forw: Forward axis vector defining the full system convention (forward orientation on ground plane).
         Returns:       (3x3 orientation matrix for converting 3D data points, True if POINT.?_SCREEN param was parsed).
         '''
+        key = 'axis_interpretation:%s:%s' % (list(sys_axis_up), list(sys_axis_forw))
+        if key in self._metadata:
+            orient, parsed_screen_param = self._metadata[key]
+            return np.array(orient), parsed_screen_param
+
         val = self.reader.get_screen_xy_axis()
         if val:
             axis_x, axis_y = val
@@ -196,7 +385,9 @@ class C3DParseDictionary:
         O_sys[:, 2] = sys_axis_up / np.linalg.norm(sys_axis_up)
         O_sys[:, 0] = np.cross(O_sys[:, 1], O_sys[:, 2])
         # Orient from data basis -> system basis.
-        return np.matmul(O_sys, O_data.T), parsed_screen_param
+        orient = np.matmul(O_sys, O_data.T)
+        self.store_metadata(key, [orient.tolist(), parsed_screen_param])
+        return orient, parsed_screen_param
 
     def unit_conversion(self, group_id, param_id='UNITS', sys_unit=None):
         ''' Interpret unit conversion available for a parameter.
@@ -211,6 +402,11 @@ class C3DParseDictionary:
 
         Warning! Currently only supports units of length.
         '''
+        key = 'unit_conversion:%s:%s:%s' % (group_id, param_id, sys_unit)
+        if key in self._metadata:
+            conv_fac = self._metadata[key]
+            return np.array(conv_fac) if islist(conv_fac) else conv_fac
+
         # Unit conversion dictionary.
         unit_dict = {
             # Metric
@@ -256,8 +452,10 @@ class C3DParseDictionary:
             conv_fac = conv_fac / conv2unit
 
         # Return the conversion factor.
+        self.store_metadata(key, conv_fac.tolist() if isinstance(conv_fac, np.ndarray) else float(conv_fac))
         return conv_fac
 
+    @memoized
     def parse_multi_parameter(self, group_id, param_ids, pfunction='C3DParseDictionary.parse_param_any'):
         ''' Get concatenated list of values for a group parameter stored in multiple entries.
 
@@ -314,19 +512,25 @@ class C3DParseDictionary:
     def point_labels(self, empty_label_prefix='EMPTY', missing_label_prefix='UNKNOWN'):
         ''' Determine a set of unique labels for POINT data.
         '''
+        key = 'point_labels:%s:%s' % (empty_label_prefix, missing_label_prefix)
+        if key in self._metadata:
+            labels = self._metadata[key]
+            return np.array(labels) if len(labels) > 0 else []
+
         labels = self.parse_labels('POINT')
 
         used_label_count = self.reader.point_used
         if used_label_count == 0:
-            return []
-
-        if len(labels) >= used_label_count:
+            labels = []
+        elif len(labels) >= used_label_count:
             # Return only labels associated with POINT data.
-            return labels[:used_label_count]
+            labels = labels[:used_label_count]
         else:
             # Generate labels if the number of parsed count is less then POINT samples.
             unknown = ['%s_%00i' % (missing_label_prefix, i) for i in range(used_label_count - len(labels))]
-            return np.concatenate((labels, unknown))
+            labels = np.concatenate((labels, unknown))
+        self.store_metadata(key, [str(label) for label in labels])
+        return labels
 
     @staticmethod
     def make_labels_unique(labels, empty_label_prefix='EMPTY'):
@@ -363,10 +567,18 @@ class C3DParseDictionary:
             group:  Group labels are associated with, should be 'POINT' or 'ANALOG'.
             Return: Mask defined using a numpy bool array of equal shape to label argument.
         '''
+        # Mask is cached in regard to the labels it was generated for.
+        key = 'label_mask:%s:%s' % (group, hashlib.sha1('\n'.join(labels).encode('utf-8')).hexdigest())
+        if key in self._metadata:
+            return np.array(self._metadata[key], dtype=bool)
+
         soft_dict = self.software_dictionary()
         if soft_dict is not None:
-            return self.generate_software_label_mask(soft_dict, labels, group)
-        return np.ones(np.shape(labels), dtype=bool)
+            mask = self.generate_software_label_mask(soft_dict, labels, group)
+        else:
+            mask = np.ones(np.shape(labels), dtype=bool)
+        self.store_metadata(key, mask.tolist())
+        return mask
 
     def generate_software_label_mask(self, soft_dict, labels, group='POINT'):
         ''' Generate a label mask in regard to the software used to generate the file.
@@ -412,13 +624,18 @@ class C3DParseDictionary:
         #   vary the approach used when parsing files generated from specific exporters.
         #   Changes and adaptations are welcome if relevant.
         #
+        if 'software_dictionary' in self._metadata:
+            return self._metadata['software_dictionary']
+
         software = self.parse_param_string('MANUFACTURER', 'SOFTWARE')
 
+        soft_dict = None
         if software is not None:
             if 'vicon' in software.lower():
-                return C3DParseDictionary.vicon_dictionary()
-        # No specific software matched.
-        return None
+                soft_dict = C3DParseDictionary.vicon_dictionary()
+        # None if no specific software matched.
+        self.store_metadata('software_dictionary', soft_dict)
+        return soft_dict
 
     @staticmethod
     def vicon_dictionary():
@@ -484,6 +701,7 @@ class C3DParseDictionary:
             return None
         return func(self, group_id, param_id)
 
+    @memoized
     def parse_param_any(self, group_id, param_id):
         '''
         Parse param as either a 32 bit floating point value or an integer unsigned integer representation
@@ -503,6 +721,7 @@ class C3DParseDictionary:
         else:
             return self.parse_param_uint_array(group_id, param_id)
 
+    @memoized
     def parse_param_string(self, group_id, param_id):
         ''' Get a string or list of strings from the specified parameter.
 
@@ -519,10 +738,9 @@ class C3DParseDictionary:
         # Strip
         if np.ndim(strarr) == 1 and len(strarr) == 1:
             return strarr[0].strip()
-        for i, v in np.ndenumerate(strarr):
-            strarr[i] = v.strip()
-        return strarr
+        return np.char.strip(strarr)
 
+    @memoized
     def parse_param_float_array(self, group_id, param_id):
         ''' Get a ndarray of integers from a group parameter.
 
@@ -537,6 +755,7 @@ class C3DParseDictionary:
             return
         return param.float_array
 
+    @memoized
     def parse_param_int_array(self, group_id, param_id):
         ''' Get a ndarray of integers from a group parameter.
 
@@ -553,6 +772,7 @@ class C3DParseDictionary:
             return self.parse_param_string(group_id, param_id)
         return param.int_array
 
+    @memoized
     def parse_param_uint_array(self, group_id, param_id):
         ''' Get a ndarray of integers from a group parameter.
 
@@ -569,6 +789,7 @@ class C3DParseDictionary:
             return self.parse_param_string(group_id, param_id)
         return param.uint_array
 
+    @memoized
     def parse_param_any_integer(self, group_id, param_id):
         ''' Evaluate any reasonable conversion of the parameter to a 32 bit unsigned integer representation.
 
@@ -583,6 +804,7 @@ class C3DParseDictionary:
             return None
         return param._as_any_uint
 
+    @memoized
     def parse_param_int(self, group_id, param_id):
         ''' Get a single signed integers from a parameter group.
 
@@ -597,6 +819,7 @@ class C3DParseDictionary:
             return None
         return param.int_value
 
+    @memoized
     def parse_param_uint(self, group_id, param_id):
         ''' Get a single unsigned integers from a parameter group.
 
@@ -611,6 +834,7 @@ class C3DParseDictionary:
             return None
         return param.uint_value
 
+    @memoized
     def parse_param_float(self, group_id, param_id):
         ''' Get a single floating point value from a parameter group.
 
@@ -0,0 +1,381 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  io_anim_c3d is is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# Script copyright (C) Mattias Fredriksson
+
+# pep8 compliancy:
+#   flake8 .\c3d_pipeline.py
+
+''' Decoding of .c3d files into arrays used to create the imported animation.
+
+Functions in this module do not depend on Blender and can run on any thread, or outside of Blender.
+'''
+import os
+import threading
+import numpy as np
+from .perfmon import new_monitor
+from .c3d_parse_dictionary import C3DParseDictionary
+
+
+class DecodedFile():
+    ''' POINT data and associated information decoded from a .c3d file, with no dependency on Blender data.
+
+    Attributes:
+    -----
+    filepath:       Path to the decoded file.
+    file_name:      Name of the file without extension, used to name created data.
+    reports:        List of (type, message) pairs that should be reported by the operator.
+    labels:         Unique label for each decoded POINT channel, shape (nlabels,).
+    frame_times:    Keyframe time for each decoded frame, shape (nframes,).
+    point_frames:   Re-oriented and scaled sample coordinates, shape (nframes, nlabels, 3).
+    valid_samples:  Boolean mask for samples to keyframe, shape (nframes, nlabels).
+    reduced:        True if keyframes were reduced by reduce_keyframes(), the keyframes must then be linearly
+                    interpolated to reproduce the samples within the tolerance.
+    events:         List of (keyframe time, label) pairs for events in the file.
+    cancelled:      True if the file contained no data to import.
+    buffer_pool:    BufferPool the point_frames buffer was acquired from, or None.
+    '''
+
+    def __init__(self, filepath, buffer_pool=None):
+        self.filepath = filepath
+        self.file_name = os.path.splitext(os.path.basename(filepath))[0]
+        self.reports = []
+        self.labels = None
+        self.frame_times = None
+        self.point_frames = None
+        self.valid_samples = None
+        self.reduced = False
+        self.events = []
+        self.cancelled = False
+        self.buffer_pool = buffer_pool
+
+    def report(self, type, message):
+        ''' Store a message to report through the operator.
+        '''
+        self.reports.append((type, message))
+
+    def cancel(self, message):
+        ''' Cancel the import with a warning message.
+        '''
+        self.report({'WARNING'}, message)
+        self.cancelled = True
+        return self
+
+    def release(self):
+        ''' Return the point_frames buffer to the pool it was acquired from, the decoded samples are discarded.
+        '''
+        if self.buffer_pool is not None and self.point_frames is not None:
+            self.buffer_pool.release(self.point_frames)
+        self.point_frames = None
+        self.valid_samples = None
+
+
+class BufferPool():
+    ''' Pool of memory buffers reused when decoding a batch of files, shared between threads.
+
+    Released buffers are kept and handed out for later requests of equal or smaller size, so decoding files of
+    similar length only allocates memory for the first few files.
+    '''
+
+    def __init__(self):
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self, shape, dtype=np.float32):
+        ''' Get an uninitialized array, backed by the smallest free buffer large enough to hold it.
+
+        Params:
+        -----
+        shape:      Shape of the array.
+        dtype:      Data type of the array.
+        Returns:    Array viewing the start of a pooled buffer, return it with release() once it's no longer used.
+        '''
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        buffer = None
+        with self._lock:
+            fits = [buffer for buffer in self._free if buffer.nbytes >= nbytes]
+            if fits:
+                buffer = min(fits, key=lambda buffer: buffer.nbytes)
+                self._free = [free for free in self._free if free is not buffer]
+        if buffer is None:
+            buffer = np.empty(nbytes, np.uint8)
+        return buffer[:nbytes].view(dtype).reshape(shape)
+
+    def release(self, array):
+        ''' Return the buffer backing an array (or a view of it) acquired from the pool.
+        '''
+        buffer = array if array.base is None else array.base
+        with self._lock:
+            if all(free is not buffer for free in self._free):
+                self._free.append(buffer)
+
+    def clear(self):
+        ''' Discard all free buffers.
+        '''
+        with self._lock:
+            self._free = []
+
+
+def decode_file(filepath, fps, manual_orient=None,
+                global_scale=1.0,
+                adapt_frame_rate=True,
+                max_residual=0.0,
+                keyframe_tolerance=0.0,
+                frame_start=0,
+                frame_end=-1,
+                frame_step=1,
+                include_event_markers=False,
+                apply_label_mask=True,
+                cache=None,
+                buffer_pool=None,
+                print_file=False,
+                perf_mon=True):
+    ''' Decode POINT data from a .c3d file. No Blender data is accessed, and the function can run on any thread.
+
+    Params:
+    -----
+    filepath:       Path to the .c3d file.
+    fps:            Scene frame rate, used if adapt_frame_rate is True.
+    manual_orient:  3x3 orientation matrix applied to the data, if None the orientation is parsed from the file.
+    cache:          Optional MetadataCache used to store and fetch metadata interpreted from the file.
+    buffer_pool:    Optional BufferPool to decode the samples into, the buffer is returned to the pool by
+                    DecodedFile.release() once the decoded data is no longer used.
+    Returns:        DecodedFile instance.
+    '''
+    data = DecodedFile(filepath, buffer_pool)
+
+    # Monitor performance
+    perfmon = new_monitor(print_output=perf_mon)
+    perfmon.level_up('Decoding: %s ...' % os.path.basename(filepath), True)
+
+    # Open file and read .c3d parameter headers
+    with C3DParseDictionary(filepath, cache=cache) as parser:
+        if print_file:
+            parser.print_file()
+        if parser.point_used == 0:
+            return data.cancel('No POINT data in file: %s' % filepath)
+
+        # Factor converting .
+        conv_fac_frame_rate = 1.0
+        if adapt_frame_rate:
+            conv_fac_frame_rate = fps / parser.frame_rate
+
+        # Conversion factor for length measurements.
+        blend_units = 'm'
+        conv_fac_spatial_unit = parser.unit_conversion('POINT', sys_unit=blend_units)
+
+        # World orientation adjustment.
+        scale = global_scale * conv_fac_spatial_unit
+        if manual_orient is not None:
+            global_orient = manual_orient * scale
+        else:
+            global_orient, parsed_screen_param = parser.axis_interpretation([0, 0, 1], [0, 1, 0])
+            global_orient *= scale  # Uniformly scale the axis.
+
+            if not parsed_screen_param:
+                data.report({'INFO'}, 'Unable to parse X/Y_SCREEN information for POINT data, ' +
+                                      'manual adjustment to orientation may be necessary.')
+
+        # Read labels, remove labels matching hard-coded criteria
+        # regarding the software used to generate the file.
+        labels = parser.point_labels()
+        if apply_label_mask:
+            point_mask = parser.generate_label_mask(labels, 'POINT')
+        else:
+            point_mask = np.ones(np.shape(labels), bool)
+        data.labels = C3DParseDictionary.make_labels_unique(labels[point_mask])
+        # Equivalent to the number of channels used in POINT data.
+        if len(data.labels) == 0:
+            return data.cancel('All POINT data was culled in file: %s' % filepath)
+
+        # Number of frames [first, last] => +1.
+        # first_frame is the frame number of the first frame recorded in the file.
+        # frame_range is the range of frame indices (relative to first_frame) to parse.
+        first_frame = parser.first_frame
+        frame_stop = None if frame_end < 0 else frame_end + 1
+        frame_range = range(parser.last_frame - first_frame + 1)[frame_start:frame_stop:frame_step]
+        if len(frame_range) == 0:
+            return data.cancel('No frames in the selected frame range for file: %s' % filepath)
+        perfmon.message('Parsing: %i frames...' % len(frame_range))
+
+        # Load
+        read_data(data, parser, point_mask, global_orient,
+                  first_frame, frame_range, conv_fac_frame_rate,
+                  max_residual, keyframe_tolerance,
+                  perfmon)
+
+        # Parse events in the file (if specified).
+        if include_event_markers:
+            read_events(data, parser, conv_fac_frame_rate)
+
+    perfmon.level_down("Decoding finished.")
+    return data
+
+
+def read_events(data, parser, conv_fac_frame_rate):
+    ''' Read events from the loaded c3d file and store them as (frame, label) pairs in the decoded data.
+    '''
+    try:
+        data.events = [(int(np.round(frame * conv_fac_frame_rate)), label) for (frame, label) in parser.events()]
+    except ValueError as e:
+        data.report({'WARNING'}, str(e))
+    except TypeError as e:
+        data.report({'WARNING'}, str(e))
+
+
+def read_data(data, parser, point_mask, global_orient,
+              first_frame, frame_range, conv_fac_frame_rate,
+              max_residual, keyframe_tolerance,
+              perfmon):
+    '''   Read valid POINT data from the file and store the samples to keyframe in the decoded data.
+
+    Params:
+    -----
+    frame_range:        Range of frame indices, relative to the first frame in the file, to read and keyframe.
+    keyframe_tolerance: If > 0, keyframes are reduced using the tolerance, see reduce_keyframes().
+    '''
+    ##
+    # Read POINT blocks in the range in a single pass (analog signals from force plates etc. are not supported).
+    perfmon.level_up('Reading POINT data..', True)
+    out = None
+    if data.buffer_pool is not None:
+        out = (data.buffer_pool.acquire((len(frame_range), np.count_nonzero(point_mask), 5)), None)
+    # Only channels included by the label mask are decoded.
+    frame_numbers, points, _ = parser.data_reader.read_frames_array(start=frame_range.start,
+                                                                    stop=frame_range.stop,
+                                                                    step=frame_range.step,
+                                                                    include_analog=False,
+                                                                    point_channels=point_mask,
+                                                                    out=out)
+    # Determine valid samples.
+    valid_samples = points[:, :, 3] >= 0.0
+    if max_residual > 0.0:
+        valid_samples &= points[:, :, 3] < max_residual
+
+    # Position coordinates in columns 0:3 are re-oriented and scaled in place.
+    point_frames = points[:, :, :3]
+    orient_points(point_frames, global_orient)
+
+    perfmon.level_down('Reading Done.')
+
+    frame_times = (frame_numbers - first_frame) * conv_fac_frame_rate
+    if keyframe_tolerance > 0.0:
+        perfmon.level_up('Reducing keyframes..', True)
+        nsamples = np.count_nonzero(valid_samples)
+        valid_samples = reduce_keyframes(frame_times, point_frames, valid_samples, keyframe_tolerance)
+        data.reduced = True
+        perfmon.message('Reduced %i keyframes to %i.' % (nsamples, np.count_nonzero(valid_samples)))
+        perfmon.level_down('Reduction Done.')
+
+    data.frame_times = frame_times
+    data.point_frames = point_frames
+    data.valid_samples = valid_samples
+
+
+def orient_points(point_frames, orient, block_size=65536):
+    ''' Transform sample coordinates by an orientation matrix, in place.
+
+    Frames are transformed in blocks, bounding the temporary memory used to the size of a block.
+
+    Params:
+    -----
+    point_frames:   Sample coordinates, shape (nframes, nlabels, 3).
+    orient:         3x3 matrix transforming the coordinates.
+    block_size:     Approximate number of samples transformed in each block.
+    '''
+    orient_t = np.transpose(orient)
+    step = max(1, block_size // max(1, point_frames.shape[1]))
+    for i in range(0, len(point_frames), step):
+        block = point_frames[i:i + step]
+        block[...] = np.matmul(block, orient_t)
+
+
+def reduce_keyframes(frame_times, point_frames, valid_samples, tolerance):
+    ''' Remove samples that can be linearly interpolated from the remaining keyframes of a label.
+
+    Samples are reduced using the Ramer-Douglas-Peucker algorithm, evaluated for all labels at once. In each
+    pass the sample with the largest deviation from the line between two remaining keyframes is kept, if its
+    distance is greater than the tolerance. The first and last valid sample of each label is always kept.
+
+    Every removed sample is within the tolerance of the linear interpolation between the neighbouring keyframes
+    of the label. The guarantee only holds for keyframes with LINEAR interpolation, as other modes (such as
+    BEZIER) deviate from the line between keyframes.
+
+    Params:
+    -----
+    frame_times:    Keyframe time for each sample frame, shape (nframes,).
+    point_frames:   Sample coordinates, shape (nframes, nlabels, 3).
+    valid_samples:  Boolean mask for samples to keyframe, shape (nframes, nlabels).
+    tolerance:      Maximum distance (in the units of point_frames) between a removed sample and the line
+                    interpolating the remaining keyframes.
+    Returns:        Boolean mask of shape (nframes, nlabels) for the samples to keyframe.
+    '''
+    # Flatten valid samples so samples for each label are stored in sequence.
+    label_ind, frame_ind = np.nonzero(valid_samples.T)
+    nsamples = len(frame_ind)
+    reduced = np.zeros_like(valid_samples)
+    if nsamples == 0:
+        return reduced
+    times = frame_times[frame_ind]
+    # Coordinates are stored per axis to evaluate the error for a single axis at a time.
+    coords = np.ascontiguousarray(point_frames[frame_ind, label_ind].T, dtype=float)
+
+    # Keep the first and last sample for each label, these bound the initial segment of each label.
+    label_edge = np.flatnonzero(label_ind[1:] != label_ind[:-1])
+    seg_first = np.r_[0, label_edge + 1]
+    seg_last = np.r_[label_edge, nsamples - 1]
+    keep = np.zeros(nsamples, dtype=bool)
+    keep[seg_first] = True
+    keep[seg_last] = True
+
+    # Each pass evaluates all open segments, segments are closed once no sample exceeds the tolerance.
+    tolerance_sq = tolerance * tolerance
+    while True:
+        # Discard segments without samples between the bounding keyframes.
+        interior = seg_last - seg_first - 1
+        open_seg = interior > 0
+        seg_first, seg_last, interior = seg_first[open_seg], seg_last[open_seg], interior[open_seg]
+        if len(seg_first) == 0:
+            break
+        # Sample indices between the keyframes of each segment.
+        offsets = np.cumsum(interior) - interior
+        owner = np.repeat(np.arange(len(seg_first)), interior)
+        samples = np.arange(len(owner)) - offsets[owner] + seg_first[owner] + 1
+        # Squared distance between each sample and the line interpolating the segment keyframes.
+        first = seg_first[owner]
+        last = seg_last[owner]
+        weight = (times[samples] - times[first]) / (times[last] - times[first])
+        error = np.zeros(len(samples))
+        for axis in coords:
+            first_co = axis[first]
+            deviation = axis[samples] - first_co - weight * (axis[last] - first_co)
+            error += deviation * deviation
+        # Split each segment at the sample with the largest error, if above the tolerance.
+        seg_error = np.maximum.reduceat(error, offsets)
+        split_ind = np.flatnonzero(error == seg_error[owner])
+        # Only a single sample per segment (in case of equal errors).
+        split_ind = split_ind[np.r_[True, owner[split_ind[1:]] != owner[split_ind[:-1]]]]
+        split = seg_error > tolerance_sq
+        split_sample = samples[split_ind][split]
+        keep[split_sample] = True
+        seg_first = np.r_[seg_first[split], split_sample]
+        seg_last = np.r_[split_sample, seg_last[split]]
+
+    reduced[frame_ind[keep], label_ind[keep]] = True
+    return reduced
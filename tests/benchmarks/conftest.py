@@ -0,0 +1,21 @@
+''' Fixtures for benchmarking the import pipeline outside of Blender.
+
+Files are generated with the helpers shared with the headless tests, see tests/headless/testfiles.py.
+'''
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'headless'))
+from testfiles import write_c3d  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def c3d_files(tmp_path_factory):
+    ''' Synthetic .c3d files for benchmarks, keyed by name.
+    '''
+    directory = tmp_path_factory.mktemp('c3d')
+    return {
+        'float': write_c3d(str(directory / 'float.c3d'), 6000, 60, nanalog=16, analog_per_frame=10),
+        'int': write_c3d(str(directory / 'int.c3d'), 6000, 60, nanalog=16, analog_per_frame=10, point_scale=0.1),
+    }
@@ -0,0 +1,40 @@
+''' Benchmarks for opening .c3d files and the memory held by the parsed metadata, run with:
+
+`python -m pytest tests/benchmarks`
+'''
+import gc
+import tracemalloc
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from io_anim_c3d import c3d  # noqa: E402
+
+
+def open_metadata(path, lazy=False):
+    ''' Read the header and parameters of a file, the returned reader can't read frame data.
+    '''
+    with open(path, 'rb') as handle:
+        return c3d.Reader(handle, lazy=lazy)
+
+
+def metadata_footprint(path, lazy=False, count=20):
+    ''' Average number of bytes allocated for the metadata of a file kept in memory.
+    '''
+    open_metadata(path, lazy)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        readers = [open_metadata(path, lazy) for _ in range(count)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del readers
+    return size // count
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_metadata_footprint(benchmark, c3d_files, lazy):
+    benchmark.extra_info['bytes_per_file'] = metadata_footprint(c3d_files['float'], lazy)
+    reader = benchmark(open_metadata, c3d_files['float'], lazy)
+    assert reader.point_used == 60
@@ -0,0 +1,34 @@
+''' Benchmarks for parameter lookups memoized by C3DParseDictionary, run with:
+
+`python -m pytest tests/benchmarks`
+'''
+import timeit
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from io_anim_c3d.c3d_parse_dictionary import C3DParseDictionary  # noqa: E402
+
+
+def call_time(function, *args, number=2000):
+    ''' Shortest time of a number of repeated calls, in seconds per call.
+    '''
+    return min(timeit.repeat(lambda: function(*args), number=number, repeat=5)) / number
+
+
+@pytest.mark.parametrize('method, args', [
+    ('get_param', ('POINT', 'USED')),
+    ('parse_param_string', ('POINT', 'LABELS')),
+    ('parse_multi_parameter', ('POINT', ['LABELS'], C3DParseDictionary.parse_param_string)),
+])
+def test_memoized_hit(benchmark, c3d_files, method, args):
+    with C3DParseDictionary(c3d_files['float']) as parser:
+        memoized = getattr(parser, method)
+        unmemoized = getattr(C3DParseDictionary, method).__wrapped__.__get__(parser)
+        memoized(*args)
+
+        hit, call = call_time(memoized, *args), call_time(unmemoized, *args)
+        benchmark.extra_info['hit_us'] = hit * 1e6
+        benchmark.extra_info['unmemoized_us'] = call * 1e6
+        benchmark(memoized, *args)
+        assert hit < call
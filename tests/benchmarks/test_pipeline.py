@@ -0,0 +1,41 @@
+''' Benchmarks for decoding .c3d files without Blender, run with:
+
+`python -m pytest tests/benchmarks`
+'''
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from io_anim_c3d.c3d_pipeline import decode_file, BufferPool  # noqa: E402
+
+
+def decode_pooled(path, buffer_pool):
+    ''' Decode a file into a pooled buffer, returning the buffer to the pool once the data is checked.
+    '''
+    data = decode_file(path, 24, buffer_pool=buffer_pool, perf_mon=False)
+    shape = data.point_frames.shape
+    data.release()
+    return shape
+
+
+@pytest.mark.parametrize('name', ['float', 'int'])
+def test_decode_file(benchmark, c3d_files, name):
+    data = benchmark(decode_file, c3d_files[name], 24, perf_mon=False)
+    assert not data.cancelled
+    assert data.point_frames.shape == (6000, 60, 3)
+
+
+def test_decode_file_frame_range(benchmark, c3d_files):
+    data = benchmark(decode_file, c3d_files['float'], 24, frame_start=1000, frame_end=4999, frame_step=2,
+                     perf_mon=False)
+    assert data.point_frames.shape == (2000, 60, 3)
+
+
+def test_decode_file_keyframe_reduction(benchmark, c3d_files):
+    data = benchmark(decode_file, c3d_files['float'], 24, keyframe_tolerance=0.001, perf_mon=False)
+    assert data.valid_samples.any()
+
+
+def test_decode_file_buffer_pool(benchmark, c3d_files):
+    shape = benchmark(decode_pooled, c3d_files['float'], BufferPool())
+    assert shape == (6000, 60, 3)
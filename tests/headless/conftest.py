@@ -0,0 +1,25 @@
+''' Fixtures for testing the .c3d parser and the import pipeline outside of Blender.
+'''
+import pytest
+
+from testfiles import write_c3d, PROCESSOR_INTEL, PROCESSOR_DEC, PROCESSOR_MIPS
+
+# (processor, POINT:SCALE) for each file format tested.
+FORMATS = {
+    'intel_float': (PROCESSOR_INTEL, -1.0),
+    'intel_int': (PROCESSOR_INTEL, 0.1),
+    'dec_float': (PROCESSOR_DEC, -1.0),
+    'dec_int': (PROCESSOR_DEC, 0.1),
+    'mips_float': (PROCESSOR_MIPS, -1.0),
+    'mips_int': (PROCESSOR_MIPS, 0.1),
+}
+
+
+@pytest.fixture(scope='session')
+def format_files(tmp_path_factory):
+    ''' Small .c3d files in each processor format, keyed by format name.
+    '''
+    directory = tmp_path_factory.mktemp('formats')
+    return {name: write_c3d(str(directory / ('%s.c3d' % name)), 50, 6, nanalog=3, analog_per_frame=4,
+                            point_scale=scale, processor=processor)
+            for name, (processor, scale) in FORMATS.items()}
@@ -0,0 +1,61 @@
+''' Tests for converting DEC floats to IEEE format, run with:
+
+`python -m pytest tests/headless`
+'''
+from fractions import Fraction
+import numpy as np
+import pytest
+
+from io_anim_c3d.c3d.utils import DEC_to_IEEE_ARRAY
+
+
+def dec_word(sign, exponent, fraction):
+    ''' Pack a DEC float as stored in a file, with the two 16 bit halves swapped.
+    '''
+    bits = (sign << 31) | (exponent << 23) | fraction
+    return ((bits & 0xFFFF) << 16) | (bits >> 16)
+
+
+def dec_value(sign, exponent, fraction):
+    ''' Exact value of a DEC float: (-1)^s * 0.1f * 2^(e - 128), rounded to float32.
+    '''
+    if exponent == 0:
+        return np.float32(np.nan if sign else 0.0)
+    value = Fraction((1 << 23) | fraction, 1 << 24) * Fraction(2) ** (exponent - 128)
+    return np.float32(float(-value if sign else value))
+
+
+CASES = [
+    (0, 0, 0),              # Zero
+    (0, 0, 0x123456),       # Zero with a fraction
+    (1, 0, 0),              # Reserved operand
+    (1, 0, 0x000001),       # Reserved operand with a fraction
+    (0, 1, 0x000000),       # Subnormal, exponent 1
+    (1, 1, 0x000003),       # Subnormal, exponent 1, rounded up
+    (0, 1, 0x000002),       # Subnormal, exponent 1, tie rounded to even
+    (0, 1, 0x7FFFFF),       # Subnormal, exponent 1, rounding carry into the next bit
+    (0, 2, 0x000001),       # Subnormal, exponent 2, tie rounded to even
+    (1, 2, 0x000003),       # Subnormal, exponent 2, tie rounded up to even
+    (0, 2, 0x7FFFFF),       # Subnormal, exponent 2, rounding carry into the exponent
+    (0, 3, 0x000000),       # Smallest normal
+    (0, 129, 0x000000),     # 1.0
+    (1, 130, 0x400000),     # -3.0
+    (0, 255, 0x7FFFFF),     # Largest value
+]
+
+
+@pytest.mark.parametrize('in_place', [False, True])
+def test_dec_to_ieee_array(in_place):
+    words = np.array([dec_word(*case) for case in CASES], dtype=np.uint32)
+    expected = np.array([dec_value(*case) for case in CASES], dtype=np.float32)
+    assert dec_value(1, 130, 0x400000) == -3.0
+    assert dec_value(0, 2, 0x7FFFFF) == np.finfo(np.float32).tiny
+
+    if in_place:
+        result = DEC_to_IEEE_ARRAY(words, out=words)
+        assert np.shares_memory(result, words)
+    else:
+        result = DEC_to_IEEE_ARRAY(words)
+    assert result.dtype == np.float32
+    assert np.array_equal(result, expected, equal_nan=True)
+    assert np.array_equal(np.signbit(result), np.signbit(expected))
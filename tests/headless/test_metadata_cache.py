@@ -0,0 +1,120 @@
+''' Tests for decoding files with metadata fetched from a MetadataCache, run with:
+
+`python -m pytest tests/headless`
+'''
+import os
+import json
+import sqlite3
+import numpy as np
+import pytest
+
+from conftest import FORMATS
+from testfiles import write_c3d
+from io_anim_c3d import c3d
+from io_anim_c3d.c3d.layout import layout_from_dict, layout_to_dict
+from io_anim_c3d.c3d_metadata_cache import MetadataCache
+from io_anim_c3d.c3d_pipeline import decode_file
+
+
+def assert_decoded_equal(data, expected):
+    assert list(data.labels) == list(expected.labels)
+    assert np.array_equal(data.frame_times, expected.frame_times)
+    assert np.array_equal(data.point_frames, expected.point_frames)
+    assert np.array_equal(data.valid_samples, expected.valid_samples)
+
+
+def test_cached_decode_equal(tmp_path):
+    path = write_c3d(str(tmp_path / 'trial.c3d'), 100, 8)
+    cache = MetadataCache(str(tmp_path / 'cache'))
+    expected = decode_file(path, 24, perf_mon=False)
+
+    first = decode_file(path, 24, cache=cache, perf_mon=False)
+    assert cache.get(path) is not None
+    second = decode_file(path, 24, cache=cache, perf_mon=False)
+    assert_decoded_equal(first, expected)
+    assert_decoded_equal(second, expected)
+
+
+@pytest.mark.parametrize('name', list(FORMATS))
+def test_cached_decode_skips_parse(tmp_path, format_files, monkeypatch, name):
+    path = format_files[name]
+    cache = MetadataCache(str(tmp_path / 'cache'))
+    expected = decode_file(path, 24, frame_start=3, frame_step=2, cache=cache, perf_mon=False)
+
+    def parse(*args, **kwargs):
+        raise AssertionError('Parameter section parsed on a cache hit')
+    monkeypatch.setattr(c3d.Reader, '__init__', parse)
+    data = decode_file(path, 24, frame_start=3, frame_step=2, cache=cache, perf_mon=False)
+    assert_decoded_equal(data, expected)
+
+
+@pytest.mark.parametrize('name', list(FORMATS))
+def test_layout_dict(format_files, name):
+    with open(format_files[name], 'rb') as handle:
+        layout = c3d.Reader(handle).layout
+    restored = layout_from_dict(json.loads(json.dumps(layout_to_dict(layout))))
+    for field, value in layout._asdict().items():
+        assert np.array_equal(getattr(restored, field), value), field
+        assert np.asarray(getattr(restored, field)).dtype == np.asarray(value).dtype, field
+
+
+def test_cache_invalidated_on_change(tmp_path):
+    path = str(tmp_path / 'trial.c3d')
+    cache = MetadataCache(str(tmp_path / 'cache'))
+    write_c3d(path, 100, 8)
+    decode_file(path, 24, cache=cache, perf_mon=False)
+
+    # Same size, different labels and modification time.
+    size = os.path.getsize(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    write_c3d(path, 100, 8, labels=['N%03d' % i for i in range(8)])
+    os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+    assert os.path.getsize(path) == size
+    assert cache.get(path) is None
+    data = decode_file(path, 24, cache=cache, perf_mon=False)
+    assert list(data.labels) == ['N%03d' % i for i in range(8)]
+    assert_decoded_equal(data, decode_file(path, 24, perf_mon=False))
+
+    # Different size.
+    write_c3d(path, 120, 6, seed=1)
+    assert cache.get(path) is None
+    data = decode_file(path, 24, cache=cache, perf_mon=False)
+    assert data.point_frames.shape == (120, 6, 3)
+    assert_decoded_equal(data, decode_file(path, 24, perf_mon=False))
+
+
+def test_cache_unavailable(tmp_path):
+    path = write_c3d(str(tmp_path / 'trial.c3d'), 100, 8)
+    # Directory can't be created as a file exists at the path.
+    blocked = tmp_path / 'blocked'
+    blocked.write_text('')
+    cache = MetadataCache(str(blocked / 'cache'))
+    assert not cache.available
+    assert cache.get(path) is None
+    assert not cache.put(path, {'key': 1})
+    assert_decoded_equal(decode_file(path, 24, cache=cache, perf_mon=False), decode_file(path, 24, perf_mon=False))
+
+
+def test_cache_corrupt(tmp_path):
+    path = write_c3d(str(tmp_path / 'trial.c3d'), 100, 8)
+    cache = MetadataCache(str(tmp_path / 'cache'))
+    decode_file(path, 24, cache=cache, perf_mon=False)
+    with open(cache.db_path, 'wb') as handle:
+        handle.write(b'not a database' * 100)
+    assert cache.get(path) is None
+    assert not cache.put(path, {'key': 1})
+    assert_decoded_equal(decode_file(path, 24, cache=cache, perf_mon=False), decode_file(path, 24, perf_mon=False))
+
+
+def test_cache_locked(tmp_path):
+    path = write_c3d(str(tmp_path / 'trial.c3d'), 100, 8)
+    cache = MetadataCache(str(tmp_path / 'cache'), timeout=0.01)
+    lock = sqlite3.connect(cache.db_path)
+    try:
+        lock.execute('BEGIN EXCLUSIVE')
+        assert cache.get(path) is None
+        assert not cache.put(path, {'key': 1})
+        data = decode_file(path, 24, cache=cache, perf_mon=False)
+    finally:
+        lock.close()
+    assert_decoded_equal(data, decode_file(path, 24, perf_mon=False))
@@ -0,0 +1,59 @@
+''' Tests for refreshing values parsed by C3DParseDictionary after parameters are modified, run with:
+
+`python -m pytest tests/headless`
+'''
+import numpy as np
+
+from testfiles import write_c3d
+from io_anim_c3d.c3d_metadata_cache import MetadataCache
+from io_anim_c3d.c3d_parse_dictionary import C3DParseDictionary
+
+
+def set_labels(parser, param_id, labels):
+    ''' Overwrite a POINT label parameter of the file opened by the parser.
+    '''
+    group = parser.reader._groups['POINT']
+    group.set_str(param_id, '', ''.join(labels), len(labels[0]), len(labels))
+
+
+def test_invalidate_extended_ids(tmp_path):
+    path = write_c3d(str(tmp_path / 'labels.c3d'), 10, 4)
+    with C3DParseDictionary(path) as parser:
+        set_labels(parser, 'LABELS2', ['A1', 'A2'])
+        assert list(parser.parse_labels('POINT')[4:]) == ['A1', 'A2']
+        assert parser.parse_param_string(group_id='POINT', param_id='LABELS2')[0] == 'A1'
+
+        set_labels(parser, 'LABELS2', ['B1', 'B2'])
+        parser.invalidate('POINT', 'LABELS')
+        assert list(parser.parse_labels('POINT')[4:]) == ['B1', 'B2']
+        # Memoized with keyword arguments.
+        assert parser.parse_param_string(group_id='POINT', param_id='LABELS2')[0] == 'B1'
+
+
+def test_invalidate_memoized_in_multi_parameter(tmp_path):
+    path = write_c3d(str(tmp_path / 'labels.c3d'), 10, 4)
+    with C3DParseDictionary(path) as parser:
+        set_labels(parser, 'LABELS2', ['A1', 'A2'])
+        assert list(parser.parse_labels('POINT')[4:]) == ['A1', 'A2']
+
+        set_labels(parser, 'LABELS2', ['B1', 'B2'])
+        parser.invalidate('POINT', 'LABELS2')
+        assert list(parser.parse_labels('POINT')[4:]) == ['B1', 'B2']
+
+
+def test_invalidate_cached_metadata(tmp_path):
+    path = write_c3d(str(tmp_path / 'labels.c3d'), 10, 4)
+    cache = MetadataCache(str(tmp_path / 'cache'))
+    with C3DParseDictionary(path, cache=cache) as parser:
+        labels = parser.point_labels()
+    with C3DParseDictionary(path, cache=cache) as parser:
+        assert np.array_equal(parser.point_labels(), labels)
+
+        set_labels(parser, 'LABELS', ['N001', 'N002', 'N003', 'N004'])
+        parser.invalidate()
+        assert list(parser.point_labels()) == ['N001', 'N002', 'N003', 'N004']
+        assert list(parser.parse_labels('POINT')) == ['N001', 'N002', 'N003', 'N004']
+
+    # Values interpreted from the modified parameters are not stored in the cache.
+    with C3DParseDictionary(path, cache=cache) as parser:
+        assert np.array_equal(parser.point_labels(), labels)
@@ -0,0 +1,52 @@
+''' Tests for reducing keyframes decoded from .c3d files, run with:
+
+`python -m pytest tests/headless`
+'''
+import numpy as np
+import pytest
+
+from testfiles import write_c3d
+from io_anim_c3d.c3d_pipeline import decode_file, reduce_keyframes
+
+
+def linear_error(frame_times, point_frames, valid_samples, reduced):
+    ''' Largest distance between a valid sample and the linear interpolation of the reduced keyframes, for each label.
+    '''
+    errors = np.zeros(valid_samples.shape[1])
+    for label in range(valid_samples.shape[1]):
+        valid, keys = valid_samples[:, label], reduced[:, label]
+        if not np.any(valid):
+            continue
+        interpolated = np.stack([np.interp(frame_times[valid], frame_times[keys], point_frames[keys, label, axis])
+                                 for axis in range(3)], axis=-1)
+        errors[label] = np.max(np.linalg.norm(interpolated - point_frames[valid, label], axis=-1))
+    return errors
+
+
+@pytest.mark.parametrize('tolerance', [1e-3, 1e-2, 0.1, 1.0])
+def test_reduce_keyframes_tolerance(tolerance):
+    rng = np.random.default_rng(0)
+    frame_times = np.arange(300) * 0.4
+    point_frames = np.cumsum(rng.normal(scale=0.01, size=(300, 5, 3)), axis=0)
+    valid_samples = rng.random((300, 5)) > 0.1
+    valid_samples[:, 4] = False
+
+    reduced = reduce_keyframes(frame_times, point_frames, valid_samples, tolerance)
+    assert not np.any(reduced & ~valid_samples)
+    assert 0 < np.count_nonzero(reduced) < np.count_nonzero(valid_samples)
+    for label in range(4):
+        valid = np.flatnonzero(valid_samples[:, label])
+        assert reduced[valid[0], label] and reduced[valid[-1], label]
+    assert np.all(linear_error(frame_times, point_frames, valid_samples, reduced) <= tolerance)
+
+
+def test_decode_reduced(tmp_path):
+    path = write_c3d(str(tmp_path / 'trial.c3d'), 200, 6)
+    full = decode_file(path, 24, perf_mon=False)
+    assert not full.reduced
+
+    data = decode_file(path, 24, keyframe_tolerance=0.01, perf_mon=False)
+    assert data.reduced
+    assert np.count_nonzero(data.valid_samples) < np.count_nonzero(full.valid_samples)
+    errors = linear_error(full.frame_times, full.point_frames, full.valid_samples, data.valid_samples)
+    assert np.all(errors <= 0.01)
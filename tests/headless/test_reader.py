@@ -0,0 +1,192 @@
+''' Tests verifying the array, chunked and sliced read paths of c3d.Reader against read_frames(), run with:
+
+`python -m pytest tests/headless`
+'''
+import numpy as np
+import pytest
+
+from conftest import FORMATS
+from io_anim_c3d import c3d
+
+SLICES = [
+    (None, None, None),
+    (3, 40, 7),
+    (-10, None, 2),
+    (-5, -1, None),
+    (10, 10, None),
+    (30, 20, None),
+    (45, 100, None),
+]
+
+
+def open_reader(path, mmap):
+    handle = open(path, 'rb')
+    return c3d.Reader(handle, mmap=mmap)
+
+
+def read_reference(reader, **kwargs):
+    ''' Read every frame with read_frames(), stacked as arrays.
+    '''
+    frames = list(reader.read_frames(**kwargs))
+    npoints = reader.point_used
+    if kwargs.get('point_channels') is not None:
+        npoints = len(reader._point_channel_index(kwargs['point_channels']))
+    numbers = np.array([frame[0] for frame in frames], dtype=int)
+    points = np.array([frame[1] for frame in frames], dtype=np.float32).reshape(len(frames), npoints, 5)
+    analog = np.array([frame[2] for frame in frames], dtype=float).reshape(
+        len(frames), reader.analog_used, reader.analog_per_frame)
+    return numbers, points, analog
+
+
+def assert_frames_equal(result, expected):
+    numbers, points, analog = result
+    assert np.array_equal(numbers, expected[0])
+    assert np.array_equal(points, expected[1], equal_nan=True)
+    assert np.array_equal(analog, expected[2])
+
+
+@pytest.fixture(params=[False, True], ids=['read', 'mmap'])
+def mmap(request):
+    return request.param
+
+
+@pytest.fixture(params=list(FORMATS))
+def reader(request, format_files, mmap):
+    reader = open_reader(format_files[request.param], mmap)
+    yield reader
+    reader._handle.close()
+
+
+def test_formats_equal(format_files):
+    ''' Files in each processor format decode to the same data as the INTEL file they were converted from.
+    '''
+    for scale_name in ('float', 'int'):
+        expected = read_reference(open_reader(format_files['intel_%s' % scale_name], False))
+        for processor in ('dec', 'mips'):
+            result = read_reference(open_reader(format_files['%s_%s' % (processor, scale_name)], False))
+            assert np.array_equal(result[0], expected[0])
+            assert np.allclose(result[1], expected[1], equal_nan=True)
+            assert np.allclose(result[2], expected[2])
+
+
+@pytest.mark.parametrize('camera_sum', [False, True])
+def test_read_frames_array(reader, camera_sum):
+    expected = read_reference(reader, camera_sum=camera_sum)
+    assert len(expected[0]) == 50
+    assert_frames_equal(reader.read_frames_array(camera_sum=camera_sum), expected)
+
+
+@pytest.mark.parametrize('start, stop, step', SLICES)
+def test_slices(reader, start, stop, step):
+    numbers, points, analog = read_reference(reader)
+    index = slice(start, stop, step)
+    expected = numbers[index], points[index], analog[index]
+    assert_frames_equal(read_reference(reader, start=start, stop=stop, step=step), expected)
+    assert_frames_equal(reader.read_frames_array(start=start, stop=stop, step=step), expected)
+    chunks = list(reader.read_frame_chunks(4, start=start, stop=stop, step=step))
+    if chunks:
+        assert_frames_equal([np.concatenate(arrays) for arrays in zip(*chunks)], expected)
+    else:
+        assert len(expected[0]) == 0
+    assert len(reader.frame_blocks(start, stop, step)) == len(expected[0])
+
+
+def test_read_frame(reader):
+    numbers, points, analog = read_reference(reader)
+    for index in (0, 17, -1, -50):
+        frame = reader.read_frame(index)
+        assert frame[0] == numbers[index]
+        assert np.array_equal(frame[1], points[index], equal_nan=True)
+        assert np.array_equal(frame[2], analog[index])
+    with pytest.raises(IndexError):
+        reader.read_frame(50)
+
+
+@pytest.mark.parametrize('channels', [[4, 0, 2], 'mask', 'labels', []])
+def test_point_channels(reader, channels):
+    numbers, points, analog = read_reference(reader)
+    index = [4, 0, 2] if channels != [] else []
+    if channels == 'mask':
+        channels = np.isin(np.arange(reader.point_used), index)
+        index = sorted(index)
+    elif channels == 'labels':
+        channels = ['M%03d' % i for i in index]
+    expected = numbers, points[:, index], analog
+    assert_frames_equal(read_reference(reader, point_channels=channels), expected)
+    assert_frames_equal(reader.read_frames_array(point_channels=channels), expected)
+    chunks = list(reader.read_frame_chunks(16, point_channels=channels))
+    assert_frames_equal([np.concatenate(arrays) for arrays in zip(*chunks)], expected)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 25, 50, 64])
+@pytest.mark.parametrize('copy', [True, False])
+def test_read_frame_chunks(reader, chunk_size, copy):
+    expected = read_reference(reader)
+    chunks = [(numbers, points.copy(), analog.copy()) for numbers, points, analog in
+              reader.read_frame_chunks(chunk_size, copy=copy)]
+    assert [len(chunk[0]) for chunk in chunks[:-1]] == [chunk_size] * (len(chunks) - 1)
+    assert_frames_equal([np.concatenate(arrays) for arrays in zip(*chunks)], expected)
+
+
+def test_read_frame_chunks_size(reader):
+    with pytest.raises(ValueError):
+        next(reader.read_frame_chunks(0))
+
+
+def test_include_analog(reader):
+    numbers, points, _ = read_reference(reader)
+    result = reader.read_frames_array(include_analog=False)
+    assert np.array_equal(result[1], points, equal_nan=True)
+    assert result[2].size == 0
+    for frame, expected in zip(reader.read_frames(include_analog=False), points):
+        assert np.array_equal(frame[1], expected, equal_nan=True)
+        assert frame[2].size == 0
+
+
+def test_out_buffers(reader):
+    numbers, points, analog = read_reference(reader)
+    point_out = np.full((60,) + points.shape[1:], 7, np.float32)
+    analog_out = np.full((60,) + analog.shape[1:], 7.0)
+
+    result = reader.read_frames_array(start=5, stop=35, out=(point_out, analog_out))
+    assert_frames_equal(result, (numbers[5:35], points[5:35], analog[5:35]))
+    assert np.shares_memory(result[1], point_out) and np.shares_memory(result[2], analog_out)
+
+    chunks = [(frames, point.copy(), sample.copy()) for frames, point, sample in
+              reader.read_frame_chunks(16, out=(point_out, None))]
+    assert_frames_equal([np.concatenate(arrays) for arrays in zip(*chunks)], (numbers, points, analog))
+
+    frame_points, frame_analog = point_out[0], analog_out[0]
+    for i, frame in enumerate(reader.read_frames(out=(frame_points, frame_analog))):
+        assert frame[1] is frame_points and frame[2] is frame_analog
+        assert np.array_equal(frame[1], points[i], equal_nan=True)
+        assert np.array_equal(frame[2], analog[i])
+    frame = reader.read_frame(-1, out=(frame_points, None))
+    assert frame[1] is frame_points and np.array_equal(frame_points, points[-1], equal_nan=True)
+
+
+@pytest.mark.parametrize('name, points, analog', [
+    ('rows', (40, 6, 5), None),
+    ('channels', (50, 5, 5), None),
+    ('columns', (50, 6, 4), None),
+    ('dtype', np.zeros((50, 6, 5), np.int32), None),
+    ('readonly', 'readonly', None),
+    ('analog', None, (50, 2, 4)),
+])
+def test_out_buffer_errors(format_files, name, points, analog):
+    reader = open_reader(format_files['intel_float'], False)
+    if isinstance(points, tuple):
+        points = np.zeros(points, np.float32)
+    elif isinstance(points, str):
+        points = np.zeros((50, 6, 5), np.float32)
+        points.setflags(write=False)
+    if analog is not None:
+        analog = np.zeros(analog)
+    with pytest.raises(ValueError):
+        reader.read_frames_array(out=(points, analog))
+    with pytest.raises(ValueError):
+        next(reader.read_frame_chunks(50, out=(points, analog)))
+    if name != 'rows':
+        with pytest.raises(ValueError):
+            next(reader.read_frames(out=(None if points is None else points[0],
+                                         None if analog is None else analog[0])))
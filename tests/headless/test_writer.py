@@ -0,0 +1,63 @@
+''' Tests for copying and writing c3d.Writer instances, run with:
+
+`python -m pytest tests/headless`
+'''
+import io
+import copy
+import pickle
+import numpy as np
+import pytest
+
+from testfiles import c3d_bytes
+from io_anim_c3d import c3d
+
+
+def encode(writer):
+    handle = io.BytesIO()
+    writer.write(handle)
+    return handle.getvalue()
+
+
+@pytest.fixture
+def writer():
+    return c3d.Reader(io.BytesIO(c3d_bytes(10, 4, nanalog=2))).to_writer()
+
+
+@pytest.mark.parametrize('clone', [copy.deepcopy, lambda writer: pickle.loads(pickle.dumps(writer))],
+                         ids=['deepcopy', 'pickle'])
+def test_copy_independent(writer, clone):
+    expected = encode(writer)
+    other = clone(writer)
+    assert encode(other) == expected
+    assert other.get('POINT:USED').int16_value == 4
+
+    other.point_group.add_str('NEWP', '', 'abc')
+    other.rename_group('ANALOG', 'SIGNAL')
+    assert other.get('POINT:NEWP').string_value == 'abc'
+    assert other.get('SIGNAL:USED') is not None
+    assert writer.get('POINT:NEWP') is None
+    assert writer.get('SIGNAL:USED') is None
+    assert writer.get('ANALOG:USED') is not None
+    assert encode(writer) == expected
+
+
+def test_copy_group(writer):
+    group = copy.deepcopy(writer.point_group)
+    group.add_str('NEWP', '', 'abc')
+    assert writer.get('POINT:NEWP') is None
+
+
+@pytest.mark.parametrize('npoints, nanalog', [(0, 0), (3, 0), (3, 2), (5, 5)])
+def test_add_single_frame(npoints, nanalog):
+    writer = c3d.Writer()
+    frame = (np.zeros((npoints, 5), np.float32), np.zeros((nanalog, 5 if nanalog else 0)))
+    writer.add_frames(frame)
+    writer.add_frames([frame, frame])
+    assert len(writer._frames) == 3
+    assert all(np.shape(point) == (npoints, 5) for point, _ in writer._frames)
+
+
+def test_add_frames_shape_error():
+    frame = (np.zeros((3, 5), np.float32), np.zeros((0, 0)), None)
+    with pytest.raises(ValueError, match=r'\(4, 3\)'):
+        c3d.Writer().add_frames([frame] * 4)
@@ -0,0 +1,149 @@
+''' Synthetic .c3d files used by the headless tests and benchmarks.
+
+The addon package is registered under its module name without executing the addon __init__.py (which
+depends on bpy), so modules with relative imports can be loaded from the repository root.
+'''
+import io
+import os
+import sys
+import struct
+import types
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+PACKAGE = 'io_anim_c3d'
+
+if PACKAGE not in sys.modules:
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [ROOT]
+    sys.modules[PACKAGE] = package
+
+PROCESSOR_INTEL = 84
+PROCESSOR_DEC = 85
+PROCESSOR_MIPS = 86
+
+
+def c3d_bytes(nframes, npoints, nanalog=0, analog_per_frame=1, point_scale=-1.0, seed=0, labels=None):
+    ''' Encode a .c3d file (INTEL format) containing random trajectories.
+
+    Params:
+    -----
+    nframes:            Number of frames.
+    npoints:            Number of POINT channels.
+    nanalog:            Number of ANALOG channels.
+    analog_per_frame:   Number of analog samples for each frame.
+    point_scale:        POINT:SCALE parameter, negative values write data in floating point format.
+    labels:             POINT labels, defaults to 'M000', 'M001', ...
+    Returns:            Bytes of the encoded file.
+    '''
+    from io_anim_c3d.c3d import Writer
+
+    rng = np.random.default_rng(seed)
+    writer = Writer(point_rate=100.0,
+                    analog_rate=100.0 * analog_per_frame if nanalog > 0 else 0.0,
+                    point_scale=point_scale)
+    writer.set_point_labels(labels or ['M%03d' % i for i in range(npoints)])
+    writer.set_analog_labels(['A%03d' % i for i in range(nanalog)] if nanalog > 0 else None)
+
+    # Smooth trajectories with some noise and occluded samples, coordinates in millimeters.
+    time = np.arange(nframes) / 100.0
+    freq = rng.uniform(0.1, 2.0, (npoints, 3))
+    coords = 1000.0 * np.sin(time[:, None, None] * freq) + rng.normal(scale=0.5, size=(nframes, npoints, 3))
+    points = np.zeros((nframes, npoints, 5), dtype=np.float32)
+    points[:, :, :3] = coords
+    points[:, :, 3] = np.where(rng.random((nframes, npoints)) < 0.05, -1.0, 1.0)
+    points[:, :, 4] = rng.integers(0, 128, (nframes, npoints))
+    analog = rng.normal(size=(nframes, nanalog, analog_per_frame))
+    if point_scale > 0:
+        analog = np.round(analog * 100.0)
+
+    writer.add_frames([(p, a) for p, a in zip(points, analog)])
+    handle = io.BytesIO()
+    writer.write(handle)
+    return handle.getvalue()
+
+
+def write_c3d(path, nframes, npoints, nanalog=0, analog_per_frame=1, point_scale=-1.0, seed=0, labels=None,
+              processor=PROCESSOR_INTEL):
+    ''' Write a .c3d file containing random trajectories, see c3d_bytes().
+
+    Params:
+    -----
+    path:       Path to the file to write.
+    processor:  Processor format of the file, see convert_processor().
+    Returns:    Path to the file.
+    '''
+    data = c3d_bytes(nframes, npoints, nanalog, analog_per_frame, point_scale, seed, labels)
+    if processor != PROCESSOR_INTEL:
+        data = convert_processor(data, processor)
+    with open(path, 'wb') as handle:
+        handle.write(data)
+    return path
+
+
+def ieee_to_dec(words):
+    ''' Convert 32 bit words containing IEEE floats to DEC floats (as stored in a file).
+
+    Subnormal IEEE values are not supported.
+    '''
+    words = np.asarray(words, dtype=np.uint32)
+    # DEC values are a factor 4 larger for equal bit patterns.
+    words = np.where(words & 0x7FFFFFFF, words + np.uint32(0x01000000), 0).astype(np.uint32)
+    return (words >> 16) | (words << 16)
+
+
+def convert_processor(data, processor):
+    ''' Convert an INTEL .c3d file to the DEC or MIPS processor format.
+
+    For the DEC format the file must store floating point data.
+    '''
+    from io_anim_c3d.c3d.dtypes import DataTypes
+    from io_anim_c3d.c3d.header import Header
+    from io_anim_c3d.c3d.parameter import parameter_records
+
+    buffer = bytearray(data)
+    fields = struct.unpack(Header.BINARY_FORMAT_READ, bytes(buffer[:512]))
+    param_block, data_block = fields[0], fields[8]
+    float_data = struct.unpack('<f', struct.pack('<I', fields[7]))[0] < 0
+
+    def convert_words(start, nbytes, bytes_per_word):
+        if bytes_per_word not in (2, 4):
+            return
+        words = np.frombuffer(bytes(buffer[start:start + nbytes]), dtype='<u%i' % bytes_per_word)
+        if processor == PROCESSOR_DEC:
+            if bytes_per_word == 4:
+                buffer[start:start + nbytes] = ieee_to_dec(words).tobytes()
+        else:
+            buffer[start:start + nbytes] = words.astype('>u%i' % bytes_per_word).tobytes()
+
+    # Header
+    if processor == PROCESSOR_MIPS:
+        buffer[:512] = struct.pack(Header.BINARY_FORMAT_READ_BIG_ENDIAN, *fields)
+    else:
+        # Scale factor and frame rate.
+        for offset in (12, 20):
+            convert_words(offset, 4, 4)
+
+    # Parameters
+    offset = (param_block - 1) * 512
+    section = memoryview(buffer)[offset:offset + buffer[offset + 2] * 512]
+    records = list(parameter_records(section, DataTypes(PROCESSOR_INTEL)))
+    del section
+    for group_id, _, start, _ in records:
+        start += offset
+        if processor == PROCESSOR_MIPS:
+            # Offset to the next record.
+            buffer[start - 2:start] = buffer[start - 2:start][::-1]
+        if group_id < 0:
+            continue
+        bytes_per_element = struct.unpack_from('b', buffer, start)[0]
+        ndim = buffer[start + 1]
+        count = int(np.prod(list(buffer[start + 2:start + 2 + ndim])))
+        convert_words(start + 2 + ndim, count * abs(bytes_per_element), bytes_per_element)
+    buffer[offset + 3] = processor
+
+    # Data
+    offset = (data_block - 1) * 512
+    bytes_per_word = 4 if float_data else 2
+    convert_words(offset, (len(buffer) - offset) // bytes_per_word * bytes_per_word, bytes_per_word)
+    return bytes(buffer)
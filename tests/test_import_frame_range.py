@@ -0,0 +1,71 @@
+import bpy
+import os
+import unittest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class ImportC3DTestFrameRange(unittest.TestCase):
+
+    FRAME_START = 10
+    FRAME_END = 99
+    FRAME_STEP = 3
+
+    def setUpClass():
+        from tests.zipload import Zipload
+        from bpy_extras import anim_utils
+
+        Zipload.download_and_extract()
+
+        channelbags = []
+        fp = Zipload.get_c3d_path('sample01', 'Eb015pr.c3d')
+        for frame_start, frame_end, frame_step in ((0, -1, 1),
+                                                   (ImportC3DTestFrameRange.FRAME_START,
+                                                    ImportC3DTestFrameRange.FRAME_END,
+                                                    ImportC3DTestFrameRange.FRAME_STEP)):
+            # Parse
+            bpy.ops.import_anim.c3d(filepath=fp,
+                                    print_file=False,
+                                    adapt_frame_rate=False,
+                                    include_empty_labels=True,
+                                    frame_start=frame_start,
+                                    frame_end=frame_end,
+                                    frame_step=frame_step,
+                                    perf_mon=False)
+            # Fetch loaded objects
+            obj = bpy.context.selected_objects[0]
+            action = obj.animation_data.action
+            action_slot = obj.animation_data.action_slot
+            channelbags.append(anim_utils.action_get_channelbag_for_slot(action, action_slot))
+
+        ImportC3DTestFrameRange.full, ImportC3DTestFrameRange.ranged = channelbags
+
+    def test_A_channel_count(self):
+        ''' Verify number of channels are equal
+        '''
+        self.assertEqual(len(self.full.fcurves), len(self.ranged.fcurves))
+
+    def test_B_keyframe_range(self):
+        ''' Verify keyframes are only inserted for frames in the range
+        '''
+        for fc in self.ranged.fcurves:
+            for kf in fc.keyframe_points:
+                frame = int(round(kf.co[0]))
+                self.assertGreaterEqual(frame, self.FRAME_START)
+                self.assertLessEqual(frame, self.FRAME_END)
+                self.assertEqual((frame - self.FRAME_START) % self.FRAME_STEP, 0)
+
+    def test_C_keyframes_equal(self):
+        ''' Verify keyframes in the range are identical to keyframes imported from the full file
+        '''
+        for fc_full, fc_ranged in zip(self.full.fcurves, self.ranged.fcurves):
+            full_keys = {int(round(kf.co[0])): kf.co[1] for kf in fc_full.keyframe_points}
+            for kf in fc_ranged.keyframe_points:
+                self.assertAlmostEqual(full_keys[int(round(kf.co[0]))], kf.co[1])
+
+
+if __name__ == '__main__':
+    import sys
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()
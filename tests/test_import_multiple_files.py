@@ -0,0 +1,84 @@
+import bpy
+import os
+import unittest
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class ImportC3DTestMultipleFiles(unittest.TestCase):
+
+    ZIP_FOLDER = 'sample01'
+    ZIP_FILES = \
+        [
+         'Eb015pi.c3d',
+         'Eb015pr.c3d',
+         'Eb015vi.c3d',
+         'Eb015vr.c3d',
+         'Eb015si.c3d',
+         'Eb015sr.c3d'
+        ]
+
+    def setUpClass():
+        from tests.zipload import Zipload
+        from bpy_extras import anim_utils
+
+        Zipload.download_and_extract()
+
+        def channelbag(obj):
+            animation_data = obj.animation_data
+            return anim_utils.action_get_channelbag_for_slot(animation_data.action, animation_data.action_slot)
+
+        # Import each file separately
+        single = {}
+        for file in ImportC3DTestMultipleFiles.ZIP_FILES:
+            fp = Zipload.get_c3d_path(ImportC3DTestMultipleFiles.ZIP_FOLDER, file)
+            bpy.ops.import_anim.c3d(filepath=fp,
+                                    print_file=False,
+                                    perf_mon=False)
+            single[os.path.splitext(file)[0]] = channelbag(bpy.context.selected_objects[0])
+
+        # Import all files in a single call, files are then decoded concurrently
+        objects = set(bpy.data.objects)
+        directory = os.path.dirname(Zipload.get_c3d_path(ImportC3DTestMultipleFiles.ZIP_FOLDER,
+                                                         ImportC3DTestMultipleFiles.ZIP_FILES[0]))
+        result = bpy.ops.import_anim.c3d(directory=directory,
+                                         files=[{'name': file} for file in ImportC3DTestMultipleFiles.ZIP_FILES],
+                                         print_file=False,
+                                         perf_mon=False)
+        multiple = {obj.name.split('.')[0]: channelbag(obj) for obj in set(bpy.data.objects) - objects}
+
+        ImportC3DTestMultipleFiles.result = result
+        ImportC3DTestMultipleFiles.single = single
+        ImportC3DTestMultipleFiles.multiple = multiple
+
+    def test_A_all_imported(self):
+        ''' Verify an object is created for each file
+        '''
+        self.assertEqual(self.result, {'FINISHED'})
+        self.assertEqual(sorted(self.multiple.keys()), sorted(self.single.keys()))
+
+    def test_B_channels_equal(self):
+        ''' Verify channels are equal to channels imported from each file separately
+        '''
+        for name, channelbag in self.multiple.items():
+            expected = self.single[name]
+            self.assertEqual([fc.data_path for fc in channelbag.fcurves],
+                             [fc.data_path for fc in expected.fcurves])
+            self.assertEqual([grp.name for grp in channelbag.groups], [grp.name for grp in expected.groups])
+
+    def test_C_keyframes_equal(self):
+        ''' Verify keyframes are equal to keyframes imported from each file separately
+        '''
+        for name, channelbag in self.multiple.items():
+            for fc, fc_expected in zip(channelbag.fcurves, self.single[name].fcurves):
+                self.assertEqual(len(fc.keyframe_points), len(fc_expected.keyframe_points))
+                for kf, kf_expected in zip(fc.keyframe_points, fc_expected.keyframe_points):
+                    self.assertAlmostEqual(kf.co[0], kf_expected.co[0])
+                    self.assertAlmostEqual(kf.co[1], kf_expected.co[1])
+
+
+if __name__ == '__main__':
+    import sys
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()